@@ -0,0 +1,71 @@
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from io import StringIO
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# one or more blank lines, as line parsers see them after strip()
+BLANK_LINES = re.compile(rb'\r?\n(?:[ \t]*\r?\n)+')
+
+
+def record_bounds(data, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Cut 'data' into chunks of about 'chunk_size' bytes, each ending after a run of blank lines,
+    so no record is split between two chunks.
+    Lines holding only spaces or tabs count as blank, lines may end in CRLF.
+
+    >>> record_bounds(b"a:1\\nb:2\\n\\nc:3\\n\\nd:4\\n", 4)
+    [(0, 9), (9, 14), (14, 18)]
+
+    >>> record_bounds(b"a:1\\r\\nb:2\\r\\n\\r\\nc:3\\r\\n \\r\\n\\r\\nd:4\\r\\n", 4)
+    [(0, 12), (12, 22), (22, 27)]
+
+    :param data: bytes like, eg. memory mapped file
+    :param chunk_size: minimum number of bytes in a chunk, unless at the end of data
+    :return: list of start, end offsets
+    """
+    bounds = []
+    start = 0
+    while start < len(data):
+        blank = BLANK_LINES.search(data, start + chunk_size - 1)
+        end = len(data) if blank is None else blank.end()
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def _map_chunk(worker: Callable[..., T], path: str, args: tuple, start: int, end: int) -> T:
+    with open(path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        chunk = StringIO(data[start:end].decode())
+    return worker(chunk, *args)
+
+
+def map_records(worker: Callable[..., T],
+                path: str,
+                *args,
+                workers: Optional[int] = None,
+                chunk_size: int = 1 << 22) -> List[T]:
+    """
+    Call 'worker' on chunks of a memory mapped file of blank line separated records, in a process pool.
+    Each worker holds at most one chunk in memory.
+
+    :param worker: module level function, called with a text file of whole records, then 'args'
+    :param path: of records
+    :param args: passed on to every call of 'worker'
+    :param workers: number of processes, defaults to number of cpus
+    :param chunk_size: approximate number of bytes a worker processes at once
+    :return: results of 'worker' in file order, empty if file is empty
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            bounds = record_bounds(data, chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(partial(_map_chunk, worker, path, args), *zip(*bounds)))
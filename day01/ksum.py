@@ -0,0 +1,204 @@
+import random
+from bisect import insort
+import sys
+from collections import defaultdict
+from functools import reduce
+from itertools import combinations
+from time import perf_counter
+from typing import List, Optional, Sequence
+
+from day01.puzzle01 import find_summands
+
+
+def _two_sum_after(goal: int, nums: Sequence[int], start: int) -> Optional[List[int]]:
+    """
+    Find two entries of 'nums' from index 'start' on that sum to 'goal',
+    scanning from the back, so the pair with the latest entries is found, as in find_summands.
+    """
+    seen = set()
+    for idx in range(len(nums) - 1, start - 1, -1):
+        num = nums[idx]
+        if goal - num in seen:
+            return [num, goal - num]
+        seen.add(num)
+    return None
+
+
+def two_sum(goal: int, nums: Sequence[int]) -> Optional[List[int]]:
+    """
+    Find two entries of 'nums' that sum to 'goal' with a single pass over a set of seen values.
+
+    Scanning from the back picks the same pair as find_summands, which prefers later entries.
+
+    >>> two_sum(2020, [1721, 979, 366, 299, 675, 1456])
+    [1721, 299]
+
+    >>> two_sum(10, [5, 1, 5])
+    [5, 5]
+
+    >>> two_sum(10, [5]) is None
+    True
+
+    :param goal: target sum
+    :param nums: entries of expense report
+    :return: summands in input order, or None
+    """
+    return _two_sum_after(goal, nums, 0)
+
+
+def three_sum(goal: int, nums: Sequence[int]) -> Optional[List[int]]:
+    """
+    Find three entries of 'nums' that sum to 'goal', the same three as find_summands.
+
+    find_summands prefers later entries: its first summand is the last entry
+    that has two more summands after it.
+    Going from the back, the entries after the current one are kept sorted,
+    and two pointers closing in on them decide if the current entry can be the first summand.
+    Its pair is then picked with a single scan, as in two_sum.
+
+    >>> three_sum(2020, [1721, 979, 366, 299, 675, 1456])
+    [979, 366, 675]
+
+    >>> three_sum(10, [1, 2, 3, 4, 5, 6])
+    [2, 3, 5]
+
+    >>> three_sum(6, [1, 2, 2]) is None
+    True
+
+    :param goal: target sum
+    :param nums: entries of expense report
+    :return: summands in input order, or None
+    """
+    # sorted entries after the current one
+    after: List[int] = []
+    for idx in range(len(nums) - 1, -1, -1):
+        rest = goal - nums[idx]
+        lo, hi = 0, len(after) - 1
+        while lo < hi:
+            total = after[lo] + after[hi]
+            if total == rest:
+                return [nums[idx], *_two_sum_after(rest, nums, idx + 1)]
+            elif total < rest:
+                lo += 1
+            else:
+                hi -= 1
+        insort(after, nums[idx])
+    return None
+
+
+def meet_in_the_middle(goal: int, nums: Sequence[int], k: int) -> Optional[List[int]]:
+    """
+    Find 'k' entries of 'nums' that sum to 'goal'.
+    Sums of every k//2 sized combination are tabulated,
+    then the remaining k - k//2 sized combinations look up their complement.
+
+    Unlike find_summands, the first combination found is returned,
+    which is not necessarily the one with the latest entries.
+
+    >>> meet_in_the_middle(10, [1, 2, 3, 4, 5, 6], 4)
+    [1, 2, 3, 4]
+
+    >>> meet_in_the_middle(100, [1, 2, 3, 4, 5, 6], 4) is None
+    True
+
+    :param goal: target sum
+    :param nums: entries of expense report
+    :param k: number of summands
+    :return: summands in input order, or None
+    """
+    half = k // 2
+    table = defaultdict(list)
+    for indices in combinations(range(len(nums)), half):
+        table[sum(nums[i] for i in indices)].append(indices)
+
+    for indices in combinations(range(len(nums)), k - half):
+        rest = goal - sum(nums[i] for i in indices)
+        for other in table.get(rest, []):
+            if not set(indices).intersection(other):
+                return [nums[i] for i in sorted((*indices, *other))]
+    return None
+
+
+def k_sum(goal: int, nums: Sequence[int], k: int) -> Optional[List[int]]:
+    """
+    Replacement for find_summands:
+    picks the cheapest strategy for the number of summands.
+
+    For up to 3 summands the result is the same as find_summands.
+    For more, any combination that sums to 'goal' may be returned
+    if there are several, see meet_in_the_middle.
+
+    >>> k_sum(2020, [1721, 979, 366, 299, 675, 1456], 2)
+    [1721, 299]
+
+    >>> k_sum(2020, [1721, 979, 366, 299, 675, 1456], 3)
+    [979, 366, 675]
+
+    >>> k_sum(0, [1, 2], 0)
+    []
+
+    >>> k_sum(2, [1, 2], 1)
+    [2]
+
+    :param goal: target sum
+    :param nums: entries of expense report
+    :param k: number of summands
+    :return: summands in input order, or None
+    """
+    if k == 0:
+        return [] if goal == 0 else None
+    if k == 1:
+        return [goal] if goal in nums else None
+    if k == 2:
+        return two_sum(goal, nums)
+    if k == 3:
+        return three_sum(goal, nums)
+    return meet_in_the_middle(goal, nums, k)
+
+
+def benchmark(sizes: Sequence[int] = (25, 50, 100, 200, 400, 800, 1600, 3200),
+              k: int = 3,
+              naive_limit: int = 200):
+    """
+    Time find_summands against k_sum on random reports without a solution, i.e. worst case.
+    find_summands recurses once per entry, so it is only run up to 'naive_limit' entries.
+
+    :param sizes: report sizes to measure
+    :param k: number of summands
+    :param naive_limit: largest report to run find_summands on
+    :return: list of (size, find_summands seconds or None, k_sum seconds)
+    """
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 2 * naive_limit + 100))
+    results = []
+    for size in sizes:
+        # all even, the goal is odd: no solution
+        nums = [2 * random.randrange(1, 10 * size) for _ in range(size)]
+        goal = 2021
+
+        naive = None
+        if size <= naive_limit:
+            start = perf_counter()
+            find_summands(goal, nums, k)
+            naive = perf_counter() - start
+
+        start = perf_counter()
+        k_sum(goal, nums, k)
+        fast = perf_counter() - start
+
+        results.append((size, naive, fast))
+        print(f'n={size:>7}  find_summands: {"-" if naive is None else f"{naive:.4f}s":>9}  k_sum: {fast:.4f}s')
+    return results
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    with open('input.txt', 'rt') as puzzle_input:
+        numbers = [int(line) for line in puzzle_input]
+
+    n = k_sum(2020, numbers, 3)
+    print(f'sum({n}) = {sum(n)}')
+    print(reduce(lambda a, b: a*b, n))
+
+    benchmark()
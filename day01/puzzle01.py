@@ -1,5 +1,5 @@
 from functools import reduce
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 
 def find_summands(goal: int,
@@ -22,6 +22,49 @@ def find_summands(goal: int,
         find_summands(goal-nums[0], nums[1:], max_depth-1, [*resp, nums[0]])
 
 
+def all_summands(goal: int, nums: List[int], max_depth: int) -> Iterator[List[int]]:
+    """
+    Lazily generate every combination of 'max_depth' entries that sums to 'goal'.
+    Each combination of values is generated once, in ascending order,
+    even if the same value occurs multiple times in 'nums'.
+
+    >>> list(all_summands(2020, [1721, 979, 366, 299, 675, 1456], 2))
+    [[299, 1721]]
+
+    >>> list(all_summands(6, [1, 5, 2, 4, 3, 3, 1], 2))
+    [[1, 5], [2, 4], [3, 3]]
+
+    >>> list(all_summands(6, [1, 2, 3], 4))
+    []
+
+    :param goal: target sum
+    :param nums: entries to pick summands from
+    :param max_depth: number of summands
+    :return: generator of summands
+    """
+    nums = sorted(nums)
+
+    def _summands(start: int, rest: int, depth: int, resp: List[int]):
+        if depth == 0:
+            if rest == 0:
+                yield resp
+            return
+
+        for i in range(start, len(nums) - depth + 1):
+            if i > start and nums[i] == nums[i - 1]:
+                # same value at the same position was already tried
+                continue
+            if nums[i] * depth > rest:
+                # sorted: every later choice overshoots too
+                return
+            if nums[i] + nums[-1] * (depth - 1) < rest:
+                # even the largest entries cannot fill the gap
+                continue
+            yield from _summands(i + 1, rest - nums[i], depth - 1, [*resp, nums[i]])
+
+    return _summands(0, goal, max_depth, [])
+
+
 if __name__ == '__main__':
     numbers = []
     with open('input.txt', 'rt') as puzzle_input:
@@ -0,0 +1,119 @@
+import random
+from collections import Counter, defaultdict
+from functools import reduce
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class SummandIndex:
+    """
+    Index of pair sums over an expense report, to answer many goals without searching again.
+
+    Pairs are kept by value, at most two per sum:
+    any value takes part in only one pair of a given sum,
+    so one of two stored pairs is always free to combine with a third entry.
+
+    >>> index = SummandIndex([1721, 979, 366, 299, 675, 1456])
+    >>> index.find(2020, 2)
+    [299, 1721]
+
+    >>> index.find(2020, 3)
+    [366, 675, 979]
+
+    >>> index.find(1, 2) is None
+    True
+
+    >>> index.find_many([2020, 2396, 3000], 2)
+    {2020: [299, 1721], 2396: [675, 1721], 3000: None}
+    """
+    def __init__(self, numbers: Iterable[int]):
+        start = perf_counter()
+        self.counts = Counter(numbers)
+        values = sorted(self.counts)
+
+        self.pairs: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+        for i, a in enumerate(values):
+            start_j = i if self.counts[a] > 1 else i + 1
+            for b in values[start_j:]:
+                pairs = self.pairs[a + b]
+                if len(pairs) < 2:
+                    pairs.append((a, b))
+        self.pairs = dict(self.pairs)
+
+        self.build_time = perf_counter() - start
+        self.query_times: List[float] = []
+
+    def _find_pair(self, goal: int) -> Optional[List[int]]:
+        pairs = self.pairs.get(goal)
+        return list(pairs[0]) if pairs else None
+
+    def _find_triple(self, goal: int) -> Optional[List[int]]:
+        for x in self.counts:
+            for a, b in self.pairs.get(goal - x, []):
+                needed = 1 + (a == x) + (b == x)
+                if self.counts[x] >= needed:
+                    return sorted((x, a, b))
+        return None
+
+    def find(self, goal: int, k: int) -> Optional[List[int]]:
+        """
+        Find 'k' entries that sum to 'goal'.
+
+        :param goal: target sum
+        :param k: number of summands, 2 or 3
+        :return: summands in ascending order, or None
+        """
+        start = perf_counter()
+        if k == 2:
+            found = self._find_pair(goal)
+        elif k == 3:
+            found = self._find_triple(goal)
+        else:
+            raise ValueError(f'only 2 or 3 summands are indexed, got {k}')
+        self.query_times.append(perf_counter() - start)
+        return found
+
+    def find_many(self, goals: Iterable[int], k: int) -> Dict[int, Optional[List[int]]]:
+        """
+        Answer multiple goals.
+
+        :param goals: target sums
+        :param k: number of summands, 2 or 3
+        :return: summands for each goal
+        """
+        return {
+            goal: self.find(goal, k)
+            for goal in goals
+        }
+
+    def report(self) -> str:
+        """
+        :return: build time and per-query latency
+        """
+        queries = len(self.query_times)
+        mean = sum(self.query_times) / queries if queries else 0
+        return f'build: {self.build_time:.4f}s, ' \
+               f'queries: {queries}, ' \
+               f'mean: {mean * 1e6:.1f}us, ' \
+               f'max: {max(self.query_times, default=0) * 1e6:.1f}us'
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    with open('input.txt', 'rt') as puzzle_input:
+        numbers = [int(line) for line in puzzle_input]
+
+    index = SummandIndex(numbers)
+    n = index.find(2020, 3)
+    print(f'sum({n}) = {sum(n)}')
+    print(reduce(lambda a, b: a*b, n))
+
+    goals = [random.randrange(0, 6000) for _ in range(10000)]
+    index.find_many(goals, 2)
+    print('2 summands:', index.report())
+
+    index.query_times = []
+    index.find_many(goals, 3)
+    print('3 summands:', index.report())
@@ -0,0 +1,33 @@
+from collections import Counter
+
+from hypothesis import given
+from hypothesis.strategies import integers, lists
+
+from day01.ksum import k_sum
+from day01.puzzle01 import find_summands
+
+
+@given(nums=lists(integers(min_value=0, max_value=50), max_size=12),
+       goal=integers(min_value=0, max_value=120),
+       k=integers(min_value=0, max_value=4))
+def test_k_sum_matches_find_summands(nums, goal, k):
+    expected = find_summands(goal, nums, k)
+    found = k_sum(goal, nums, k)
+    if expected is None:
+        assert found is None
+    else:
+        assert len(found) == k
+        assert sum(found) == goal
+        assert not Counter(found) - Counter(nums)
+
+
+@given(nums=lists(integers(min_value=0, max_value=50), max_size=12),
+       goal=integers(min_value=0, max_value=100))
+def test_two_sum_picks_same_pair(nums, goal):
+    assert k_sum(goal, nums, 2) == find_summands(goal, nums, 2)
+
+
+@given(nums=lists(integers(min_value=0, max_value=30), max_size=12),
+       goal=integers(min_value=0, max_value=90))
+def test_three_sum_picks_same_combination(nums, goal):
+    assert k_sum(goal, nums, 3) == find_summands(goal, nums, 3)
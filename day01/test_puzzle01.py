@@ -0,0 +1,20 @@
+from itertools import combinations
+
+from hypothesis import given
+from hypothesis.strategies import integers, lists
+
+from day01.puzzle01 import all_summands
+
+
+@given(nums=lists(integers(min_value=-20, max_value=20), max_size=10),
+       goal=integers(min_value=-40, max_value=40),
+       k=integers(min_value=0, max_value=4))
+def test_all_summands_yields_every_combination_once(nums, goal, k):
+    expected = {
+        combination
+        for combination in combinations(sorted(nums), k)
+        if sum(combination) == goal
+    }
+    found = [tuple(summands) for summands in all_summands(goal, nums, k)]
+    assert len(found) == len(set(found))
+    assert set(found) == expected
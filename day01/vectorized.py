@@ -0,0 +1,131 @@
+from functools import reduce
+from time import perf_counter
+from typing import List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # optional backend
+    np = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError('the vectorized backend needs numpy: pip install numpy')
+
+
+def load(path: str) -> 'np.ndarray':
+    """
+    Parse whitespace separated integers with a single bulk read, sorted.
+
+    :param path: of puzzle input
+    :return: sorted array of entries
+    """
+    _require_numpy()
+    nums = np.fromfile(path, dtype=np.int64, sep=' ')
+    nums.sort()
+    return nums
+
+
+def _first_after(nums: 'np.ndarray', values: 'np.ndarray', after: 'np.ndarray') -> 'np.ndarray':
+    """
+    Positions of 'values' in sorted 'nums', strictly after the positions 'after',
+    or -1 where no such entry exists.
+
+    >>> _first_after(np.array([1, 2, 2, 5]), np.array([2, 2, 5, 1]), np.array([0, 1, 0, 0]))
+    array([ 1,  2,  3, -1])
+    """
+    pos = np.maximum(np.searchsorted(nums, values, 'left'), after + 1)
+    found = pos < len(nums)
+    found[found] = nums[pos[found]] == values[found]
+    return np.where(found, pos, -1)
+
+
+def two_sum(goal: int, nums: 'np.ndarray', block_size: int = 1 << 20) -> Optional[List[int]]:
+    """
+    Find two entries of sorted 'nums' that sum to 'goal'.
+    Complements of a block of entries are looked up with one searchsorted call,
+    so temporary arrays never exceed 'block_size' elements.
+
+    >>> two_sum(2020, np.array(sorted([1721, 979, 366, 299, 675, 1456])), block_size=2)
+    [299, 1721]
+
+    >>> two_sum(10, np.array([1, 5, 6]), block_size=2) is None
+    True
+
+    :param goal: target sum
+    :param nums: sorted entries
+    :param block_size: number of entries processed at once
+    :return: summands in ascending order, or None
+    """
+    _require_numpy()
+    # the smaller summand is at most goal / 2
+    end = np.searchsorted(nums, goal // 2, 'right')
+    for start in range(0, end, block_size):
+        stop = min(start + block_size, end)
+        idx = np.arange(start, stop)
+        pos = _first_after(nums, goal - nums[start:stop], idx)
+        hits = np.flatnonzero(pos >= 0)
+        if hits.size:
+            i = start + hits[0]
+            return [int(nums[i]), int(nums[pos[hits[0]]])]
+    return None
+
+
+def three_sum(goal: int, nums: 'np.ndarray', block_size: int = 1 << 20) -> Optional[List[int]]:
+    """
+    Find three entries of sorted 'nums' that sum to 'goal'.
+    The smallest summand is picked in a loop over distinct values,
+    the other two with vectorized two_sum lookups over blocks of the entries after it.
+
+    >>> three_sum(2020, np.array(sorted([1721, 979, 366, 299, 675, 1456])), block_size=2)
+    [366, 675, 979]
+
+    >>> three_sum(6, np.array([2, 2, 3]), block_size=2) is None
+    True
+
+    >>> three_sum(6, np.array([2, 2, 2]), block_size=2)
+    [2, 2, 2]
+
+    :param goal: target sum
+    :param nums: sorted entries
+    :param block_size: number of entries processed at once
+    :return: summands in ascending order, or None
+    """
+    _require_numpy()
+    n = len(nums)
+    # the smallest summand is at most goal / 3
+    last_first = np.searchsorted(nums, goal // 3, 'right')
+    i = 0
+    while i < min(last_first, n - 2):
+        first = int(nums[i])
+        rest = goal - first
+        # the middle summand is at most rest / 2
+        end = np.searchsorted(nums, rest // 2, 'right')
+        for start in range(i + 1, end, block_size):
+            stop = min(start + block_size, end)
+            idx = np.arange(start, stop)
+            pos = _first_after(nums, rest - nums[start:stop], idx)
+            hits = np.flatnonzero(pos >= 0)
+            if hits.size:
+                j = start + hits[0]
+                return [first, int(nums[j]), int(nums[pos[hits[0]]])]
+        # skip duplicates of the smallest summand
+        i = int(np.searchsorted(nums, first, 'right'))
+    return None
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    numbers = load('input.txt')
+    n = three_sum(2020, numbers)
+    print(f'sum({n}) = {sum(n)}')
+    print(reduce(lambda a, b: a*b, n))
+
+    rng = np.random.default_rng()
+    big = np.sort(rng.integers(0, 1 << 40, size=10_000_000, dtype=np.int64) * 2)
+    for block_size in (1 << 12, 1 << 16, 1 << 20):
+        start = perf_counter()
+        two_sum(big[-1] + big[-2] + 1, big, block_size)
+        print(f'two_sum over {len(big)} entries, block_size={block_size}: {perf_counter() - start:.3f}s')
@@ -0,0 +1,107 @@
+import mmap
+import os
+import random
+import string
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+from day02.parser import count_valid
+
+
+def chunk_bounds(data, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Cut 'data' into chunks of about 'chunk_size' bytes, each ending after a newline.
+
+    >>> chunk_bounds(b"aa\\nbbbb\\nc\\nd", 2)
+    [(0, 3), (3, 8), (8, 10), (10, 11)]
+
+    >>> chunk_bounds(b"", 2)
+    []
+
+    :param data: bytes like, eg. memory mapped file
+    :param chunk_size: minimum number of bytes in a chunk, unless at the end of data
+    :return: list of start, end offsets
+    """
+    bounds = []
+    start = 0
+    while start < len(data):
+        newline = data.find(b'\n', start + chunk_size - 1)
+        end = len(data) if newline == -1 else newline + 1
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def _count_chunk(path: str, start: int, end: int) -> Tuple[int, int]:
+    with open(path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return count_valid(data[start:end])
+
+
+def count_valid_parallel(path: str,
+                         workers: Optional[int] = None,
+                         chunk_size: int = 1 << 24) -> Tuple[int, int]:
+    """
+    Check both policies on chunks of a memory mapped file in a process pool.
+
+    :param path: of password log
+    :param workers: number of processes, defaults to number of cpus
+    :param chunk_size: approximate number of bytes a worker validates at once
+    :return: number of passwords valid by is_valid, by is_valid2
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return 0, 0
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            bounds = chunk_bounds(data, chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        counts = list(pool.map(_count_chunk, *zip(*((path, start, end) for start, end in bounds))))
+
+    return sum(valid for valid, _ in counts), sum(valid2 for _, valid2 in counts)
+
+
+def _random_log(file, lines: int):
+    for _ in range(lines):
+        a = random.randint(1, 10)
+        b = random.randint(a, 20)
+        ch = random.choice(string.ascii_lowercase[:5])
+        passwd = ''.join(random.choices(string.ascii_lowercase[:5], k=random.randint(b, 30)))
+        file.write(f'{a}-{b} {ch}: {passwd}\n'.encode())
+
+
+def benchmark(lines: int = 2_000_000, max_workers: Optional[int] = None, chunk_size: int = 1 << 22):
+    """
+    Time count_valid_parallel on a generated log with 1 to 'max_workers' processes.
+
+    :param lines: number of lines in generated log
+    :param max_workers: largest number of processes, defaults to number of cpus
+    :param chunk_size: approximate number of bytes a worker validates at once
+    :return: list of workers, seconds
+    """
+    max_workers = max_workers or os.cpu_count()
+    results = []
+    with tempfile.NamedTemporaryFile(suffix='.txt') as log:
+        _random_log(log, lines)
+        log.flush()
+        print(f'{lines} lines, {os.path.getsize(log.name) / 1e6:.1f} MB')
+        for workers in range(1, max_workers + 1):
+            start = perf_counter()
+            count_valid_parallel(log.name, workers, chunk_size)
+            seconds = perf_counter() - start
+            results.append((workers, seconds))
+            print(f'workers: {workers}\t{seconds:.3f}s')
+    return results
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    valid, valid2 = count_valid_parallel('input.txt')
+    print('valid by count: ', valid)
+    print('valid by position: ', valid2)
+
+    benchmark()
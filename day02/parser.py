@@ -0,0 +1,65 @@
+import re
+from typing import BinaryIO, Tuple
+
+POLICY = re.compile(rb'(\d+)-(\d+) (.): (\S*)')
+
+
+def count_valid(data: bytes) -> Tuple[int, int]:
+    """
+    Check every policy line in 'data' against both policies.
+
+    >>> count_valid(b"1-3 a: abcde\\n1-3 b: cdefg\\n2-9 c: ccccccccc\\n")
+    (2, 1)
+
+    :param data: complete lines of puzzle input
+    :return: number of passwords valid by is_valid, by is_valid2
+    """
+    valid = 0
+    valid2 = 0
+    for _min, _max, ch, passwd in POLICY.findall(data):
+        a = int(_min)
+        b = int(_max)
+        # same as is_valid
+        valid += a <= passwd.count(ch) <= b
+        # same as is_valid2
+        valid2 += (passwd[a - 1:a] == ch) ^ (passwd[b - 1:b] == ch)
+    return valid, valid2
+
+
+def count_valid_file(file: BinaryIO, block_size: int = 1 << 20) -> Tuple[int, int]:
+    """
+    Read binary file in blocks of 'block_size' bytes
+    and check both policies in a single pass.
+    The incomplete last line of a block is carried over to the next one.
+
+    >>> from io import BytesIO
+    >>> count_valid_file(BytesIO(b"1-3 a: abcde\\n1-3 b: cdefg\\n2-9 c: ccccccccc"), block_size=5)
+    (2, 1)
+
+    :param file: opened in binary mode
+    :param block_size: number of bytes read at once
+    :return: number of passwords valid by is_valid, by is_valid2
+    """
+    valid = 0
+    valid2 = 0
+    rest = b''
+    while block := file.read(block_size):
+        block = rest + block
+        end = block.rfind(b'\n') + 1
+        rest = block[end:]
+        a, b = count_valid(block[:end])
+        valid += a
+        valid2 += b
+
+    a, b = count_valid(rest)
+    return valid + a, valid2 + b
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    with open('input.txt', 'rb') as puzzle:
+        valid, valid2 = count_valid_file(puzzle)
+    print('valid by count: ', valid)
+    print('valid by position: ', valid2)
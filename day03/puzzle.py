@@ -1,5 +1,6 @@
 from functools import reduce
-from typing import Tuple, List
+from collections import defaultdict
+from typing import Iterable, List, Tuple
 
 
 def slope(dx: int, dy: int, max_y: int):
@@ -21,6 +22,52 @@ def wrap_around_map(_map: List[str], tree_symbol: str = '#'):
     return _is_tree_at
 
 
+def count_trees(rows: Iterable[str],
+                slopes: List[Tuple[int, int]],
+                tree_symbol: str = '#') -> List[int]:
+    """
+    Count trees hit along every slope in a single pass over the rows.
+    Rows are consumed one at a time, the map is never kept in memory.
+
+    >>> count_trees(['..##.......',
+    ...              '#...#...#..',
+    ...              '.#....#..#.',
+    ...              '..#.#...#.#',
+    ...              '.#...##..#.',
+    ...              '..#.##.....',
+    ...              '.#.#.#....#',
+    ...              '.#........#',
+    ...              '#.##...#...',
+    ...              '#...##....#',
+    ...              '.#..#...#.#'], [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)])
+    [2, 7, 3, 4, 2]
+
+    :param rows: of the map, eg. file like object
+    :param slopes: list of dx, dy
+    :param tree_symbol: marks a tree on the map
+    :return: number of trees for each slope
+    """
+    trees = [0] * len(slopes)
+    # slopes that visit row y are the ones where dy divides y
+    by_dy = defaultdict(list)
+    for idx, (dx, dy) in enumerate(slopes):
+        by_dy[dy].append((idx, dx))
+
+    for y, row in enumerate(rows):
+        row = row.strip()
+        width = len(row)
+        if not width:
+            continue
+        for dy, _slopes in by_dy.items():
+            if y % dy:
+                continue
+            step = y // dy
+            for idx, dx in _slopes:
+                if row[step * dx % width] == tree_symbol:
+                    trees[idx] += 1
+    return trees
+
+
 if __name__ == '__main__':
     # dx, dy
     slopes = [
@@ -31,23 +78,11 @@ if __name__ == '__main__':
         (1, 2)
     ]
 
+    import doctest
+    doctest.testmod()
+
     with open('input.txt', 'rt') as puzzle:
-        _map = [
-            line.strip()
-            for line in puzzle
-        ]
-
-    is_tree_at = wrap_around_map(_map)
-
-    trees = [
-        sum([
-            1
-            for x, y in slope(dx, dy, len(_map))
-            if is_tree_at(x, y)
-        ])
-        for dx, dy
-        in slopes
-    ]
+        trees = count_trees(puzzle, slopes)
 
     print('slopes: ', slopes)
     print('trees: ', trees)
@@ -0,0 +1,106 @@
+import mmap
+from functools import reduce
+from typing import Iterable
+
+
+class TreeMap:
+    """
+    Map of trees, each row stored as an integer bitmask:
+    bit x is set if there is a tree in column x.
+
+    >>> tree_map = TreeMap.from_lines(['..#\\n', '#..\\n', '\\n'])
+    >>> tree_map.is_tree_at(2, 0), tree_map.is_tree_at(3, 1), tree_map.is_tree_at(4, 1)
+    (True, True, False)
+
+    >>> len(tree_map)
+    2
+    """
+    def __init__(self, rows: Iterable[int], width: int):
+        self.rows = list(rows)
+        self.width = width
+
+    @staticmethod
+    def from_lines(lines: Iterable[str], tree_symbol: str = '#') -> 'TreeMap':
+        rows = []
+        width = 0
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            width = len(line)
+            # reversed, so that column x ends up at bit x
+            rows.append(int(line[::-1].replace(tree_symbol, '1').replace('.', '0'), 2))
+        return TreeMap(rows, width)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def is_tree_at(self, x: int, y: int) -> bool:
+        return bool(self.rows[y] >> (x % self.width) & 1)
+
+
+class MappedTreeMap:
+    """
+    Map of trees read directly from a memory mapped file of equally long lines,
+    for maps too tall to keep in memory.
+    Rows are not packed into bits like in TreeMap, every lookup reads a byte of the file,
+    in exchange there is nothing to load up front.
+    Blank lines at the end of the file are ignored.
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryFile() as file:
+    ...     _ = file.write(b'..#\\n#..\\n\\n')
+    ...     _ = file.seek(0)
+    ...     with MappedTreeMap(file) as tree_map:
+    ...         print(tree_map.is_tree_at(2, 0), tree_map.is_tree_at(3, 1), tree_map.is_tree_at(4, 1), len(tree_map))
+    True True False 2
+    """
+    def __init__(self, file, tree_symbol: str = '#'):
+        self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.tree = ord(tree_symbol)
+        newline = self._data.find(b'\n')
+        if newline == -1:
+            newline = len(self._data)
+        # line length including line ending
+        self.stride = newline + 1
+        self.width = newline - (self._data[newline - 1:newline] == b'\r')
+        last = len(self._data)
+        while last and self._data[last - 1] in b'\r\n':
+            last -= 1
+        # last line may have no line ending
+        self.height = -(-last // self.stride)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._data.close()
+
+    def __len__(self):
+        return self.height
+
+    def is_tree_at(self, x: int, y: int) -> bool:
+        return self._data[y * self.stride + x % self.width] == self.tree
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    from day03.puzzle import slope
+
+    slopes = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
+
+    with open('input.txt', 'rt') as puzzle:
+        tree_map = TreeMap.from_lines(puzzle)
+
+    with open('input.txt', 'rb') as puzzle, MappedTreeMap(puzzle) as mapped_tree_map:
+        for _map in (tree_map, mapped_tree_map):
+            trees = [
+                sum(_map.is_tree_at(x, y) for x, y in slope(dx, dy, len(_map)))
+                for dx, dy in slopes
+            ]
+            print(type(_map).__name__, 'trees: ', trees, '* of trees', reduce(lambda x, y: x * y, trees))
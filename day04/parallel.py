@@ -0,0 +1,33 @@
+from typing import Optional, TextIO
+
+from common.records import map_records
+from day04.puzzle import passports, is_valid_passport
+
+
+def count_valid(file: TextIO) -> int:
+    return sum(1 for passport in passports(file) if is_valid_passport(passport))
+
+
+def count_valid_parallel(path: str,
+                         workers: Optional[int] = None,
+                         chunk_size: int = 1 << 22) -> int:
+    """
+    Validate passports in chunks of a memory mapped file in a process pool.
+
+    :param path: of passport dump
+    :param workers: number of processes, defaults to number of cpus
+    :param chunk_size: approximate number of bytes a worker validates at once
+    :return: number of valid passports
+    """
+    return sum(map_records(count_valid, path, workers=workers, chunk_size=chunk_size))
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    with open('input.txt', 'rt') as puzzle:
+        sequential = count_valid(puzzle)
+
+    print('valid passports: ', count_valid_parallel('input.txt', chunk_size=1 << 10))
+    print('valid passports, sequential: ', sequential)
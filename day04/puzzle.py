@@ -1,4 +1,7 @@
-from typing import Dict
+from time import perf_counter
+from typing import Dict, Optional
+
+from day04.telemetry import Telemetry
 
 
 def birth_year(bzr: str):
@@ -77,11 +80,35 @@ def passports(file):
         yield passport
 
 
-def is_valid_passport(passport: Dict[str, str]) -> bool:
-    return all(
-        required_field in passport.keys() and is_valid(passport[required_field])
-        for required_field, is_valid in required_fields.items()
-    )
+def is_valid_passport(passport: Dict[str, str], telemetry: Optional[Telemetry] = None) -> bool:
+    """
+    >>> telemetry = Telemetry()
+    >>> is_valid_passport({'byr': '1980', 'iyr': '2012'}, telemetry)
+    False
+
+    >>> {field: (s.calls, s.failures, s.missing) for field, s in telemetry.fields.items()}
+    {'byr': (1, 0, 0), 'iyr': (1, 0, 0), 'eyr': (0, 0, 1)}
+
+    :param passport: fields of a passport
+    :param telemetry: if given, per field statistics are recorded in it
+    :return: True if all required fields are present and valid
+    """
+    if telemetry is None:
+        return all(
+            required_field in passport.keys() and is_valid(passport[required_field])
+            for required_field, is_valid in required_fields.items()
+        )
+
+    for required_field, is_valid in required_fields.items():
+        if required_field not in passport.keys():
+            telemetry.record_missing(required_field)
+            return False
+        start = perf_counter()
+        ok = is_valid(passport[required_field])
+        telemetry.record(required_field, ok, perf_counter() - start)
+        if not ok:
+            return False
+    return True
 
 
 if __name__ == '__main__':
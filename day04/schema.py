@@ -0,0 +1,166 @@
+import json
+import re
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Tuple
+
+Check = Callable[[str], bool]
+
+# same policy as required_fields in puzzle.py
+DEFAULT_RULES = {
+    "byr": {"type": "number", "min": 1920, "max": 2002},
+    "iyr": {"type": "number", "min": 2010, "max": 2020},
+    "eyr": {"type": "number", "min": 2020, "max": 2030},
+    "hgt": {"type": "measure", "units": {"cm": [150, 193], "in": [59, 76]}},
+    "hcl": {"type": "pattern", "pattern": "#[0-9a-f]{6}"},
+    "ecl": {"type": "one_of", "values": ["amb", "blu", "brn", "gry", "grn", "hzl", "oth"]},
+    "pid": {"type": "pattern", "pattern": "[0-9]{9}"},
+}
+
+# rough relative cost of each rule type, cheapest is checked first
+COSTS = {
+    "one_of": 1,
+    "pattern": 2,
+    "number": 3,
+    "measure": 4,
+}
+
+
+def _one_of(values: List[str]) -> Check:
+    return frozenset(values).__contains__
+
+
+def _pattern(pattern: str) -> Check:
+    fullmatch = re.compile(pattern).fullmatch
+
+    def _check(value: str) -> bool:
+        return fullmatch(value) is not None
+
+    return _check
+
+
+def _number(min: int, max: int) -> Check:
+    fullmatch = re.compile(r'[0-9]+').fullmatch
+
+    def _check(value: str) -> bool:
+        return fullmatch(value) is not None and min <= int(value) <= max
+
+    return _check
+
+
+def _measure(units: Dict[str, Tuple[int, int]]) -> Check:
+    fullmatch = re.compile(r'([0-9]+)(' + '|'.join(map(re.escape, units)) + ')').fullmatch
+    ranges = {unit: tuple(_range) for unit, _range in units.items()}
+
+    def _check(value: str) -> bool:
+        match = fullmatch(value)
+        if match is None:
+            return False
+        num, unit = match.groups()
+        _min, _max = ranges[unit]
+        return _min <= int(num) <= _max
+
+    return _check
+
+
+COMPILERS = {
+    "one_of": _one_of,
+    "pattern": _pattern,
+    "number": _number,
+    "measure": _measure,
+}
+
+
+class Schema:
+    """
+    Passport validator compiled from declarative rules.
+
+    >>> schema = Schema.compile(DEFAULT_RULES)
+    >>> [field for field, _ in schema.checks]
+    ['ecl', 'hcl', 'pid', 'byr', 'iyr', 'eyr', 'hgt']
+
+    >>> schema.is_valid({'pid': '087499704', 'hgt': '74in', 'ecl': 'grn', 'iyr': '2012',
+    ...                  'eyr': '2030', 'byr': '1980', 'hcl': '#623a2f'})
+    True
+
+    >>> schema.is_valid({'eyr': '1972', 'cid': '100', 'hcl': '#18171d', 'ecl': 'amb',
+    ...                  'hgt': '170', 'pid': '186cm', 'iyr': '2018', 'byr': '1926'})
+    False
+
+    >>> schema.is_valid({'ecl': 'grn'})
+    False
+    """
+    def __init__(self, checks: List[Tuple[str, Check]]):
+        self.checks = checks
+
+    @staticmethod
+    def compile(rules: Dict[str, dict]) -> 'Schema':
+        """
+        Compile rules to checks, ordered from cheapest to most expensive.
+
+        :param rules: field name -> {"type": <one of COMPILERS>, **parameters of the compiler}
+        :return: schema
+        """
+        ordered = sorted(rules.items(), key=lambda rule: COSTS[rule[1]["type"]])
+        return Schema([
+            (field, COMPILERS[rule["type"]](**{k: v for k, v in rule.items() if k != "type"}))
+            for field, rule in ordered
+        ])
+
+    @staticmethod
+    def load(file) -> 'Schema':
+        """
+        Compile rules from json config.
+
+        >>> from io import StringIO
+        >>> Schema.load(StringIO('{"ecl": {"type": "one_of", "values": ["amb"]}}')).is_valid({'ecl': 'amb'})
+        True
+        """
+        return Schema.compile(json.load(file))
+
+    def calibrate(self, passports: Iterable[Dict[str, str]]) -> 'Schema':
+        """
+        Reorder checks so the ones that reject most passports of a sample come first.
+        Rule type cost breaks ties.
+
+        >>> schema = Schema.compile(DEFAULT_RULES).calibrate([{'hgt': '170cm'}, {'hgt': '1cm'}])
+        >>> [field for field, _ in schema.checks][:2]
+        ['ecl', 'hcl']
+
+        :param passports: sample of passports
+        :return: self
+        """
+        failures = {field: 0 for field, _ in self.checks}
+        for passport in passports:
+            for field, check in self.checks:
+                value = passport.get(field)
+                if value is None or not check(value):
+                    failures[field] += 1
+        # sorted is stable: equal failure counts keep cost order
+        self.checks = sorted(self.checks, key=lambda fc: -failures[fc[0]])
+        return self
+
+    def is_valid(self, passport: Dict[str, str]) -> bool:
+        for field, check in self.checks:
+            value = passport.get(field)
+            if value is None or not check(value):
+                return False
+        return True
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    from day04.puzzle import passports, is_valid_passport
+
+    with open('input.txt', 'rt') as puzzle:
+        records = list(passports(puzzle))
+    # repeat input for measurable timing
+    records = records * 100
+
+    schema = Schema.compile(DEFAULT_RULES).calibrate(records[:1000])
+
+    for name, is_valid in (('is_valid_passport', is_valid_passport), ('Schema.is_valid', schema.is_valid)):
+        start = perf_counter()
+        valid = sum(1 for passport in records if is_valid(passport))
+        print(f'{name}: {valid} valid of {len(records)} in {perf_counter() - start:.3f}s')
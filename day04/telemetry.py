@@ -0,0 +1,51 @@
+import json
+from collections import defaultdict
+
+
+class FieldStats:
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.missing = 0
+        self.seconds = 0.0
+
+    def as_dict(self):
+        return {
+            'calls': self.calls,
+            'failures': self.failures,
+            'missing': self.missing,
+            'seconds': self.seconds,
+        }
+
+
+class Telemetry:
+    """
+    Per field validation statistics, collected by is_valid_passport(passport, telemetry=...).
+
+    >>> telemetry = Telemetry()
+    >>> telemetry.record('byr', ok=False, seconds=0.5)
+    >>> telemetry.record('byr', ok=True, seconds=0.25)
+    >>> telemetry.record_missing('pid')
+    >>> print(telemetry.to_json(indent=None))
+    {"byr": {"calls": 2, "failures": 1, "missing": 0, "seconds": 0.75}, "pid": {"calls": 0, "failures": 0, "missing": 1, "seconds": 0.0}}
+    """
+    def __init__(self):
+        self.fields = defaultdict(FieldStats)
+
+    def record(self, field: str, ok: bool, seconds: float):
+        stats = self.fields[field]
+        stats.calls += 1
+        stats.failures += not ok
+        stats.seconds += seconds
+
+    def record_missing(self, field: str):
+        self.fields[field].missing += 1
+
+    def as_dict(self):
+        return {
+            field: stats.as_dict()
+            for field, stats in self.fields.items()
+        }
+
+    def to_json(self, indent=2) -> str:
+        return json.dumps(self.as_dict(), indent=indent)
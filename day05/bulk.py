@@ -0,0 +1,86 @@
+from time import perf_counter
+from typing import Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional backend
+    np = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError('the bulk decoder needs numpy: pip install numpy')
+
+
+def seat_ids(data: bytes) -> 'np.ndarray':
+    """
+    Decode all boarding passes at once.
+    F/L are 0 bits, B/R are 1 bits, and the 10 bit number is row * 8 + col, i.e. the seat id.
+
+    >>> seat_ids(b"FBFBBFFRLR\\nBFFFBBFRRR\\nFFFBBBFRRR\\nBBFFBBFRLL")
+    array([357, 567, 119, 820])
+
+    >>> seat_ids(b"FBFBBFFRLR\\r\\nBFFFBBFRRR\\r\\n\\r\\n")
+    array([357, 567])
+
+    >>> seat_ids(b"").size
+    0
+
+    :param data: contents of puzzle input, one pass per line
+    :return: array of seat ids
+    """
+    _require_numpy()
+    # trailing blank lines would break the reshape, the last line gets back its line ending
+    data = data.rstrip()
+    if not data:
+        return np.empty(0, dtype=np.int64)
+    data += b'\r\n' if data.find(b'\r\n') != -1 else b'\n'
+    chars = np.frombuffer(data, dtype=np.uint8)
+    # line length including line ending
+    stride = data.index(b'\n') + 1
+    passes = chars.reshape(-1, stride)[:, :10]
+    bits = (passes == ord('B')) | (passes == ord('R'))
+    return bits.astype(np.int64) @ (1 << np.arange(9, -1, -1))
+
+
+def summary(ids: 'np.ndarray') -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """
+    Highest and lowest seat id, and the single unassigned seat between them.
+
+    >>> summary(np.array([5, 3, 7, 4]))
+    (7, 3, 6)
+
+    >>> summary(np.array([5, 3, 4]))
+    (5, 3, None)
+
+    >>> summary(seat_ids(b""))
+    (None, None, None)
+
+    :param ids: seat ids
+    :return: max, min, missing seat id, None if there is no gap, all None if there are no ids
+    """
+    _require_numpy()
+    if not ids.size:
+        return None, None, None
+    lowest = int(ids.min())
+    gaps = np.flatnonzero(np.bincount(ids - lowest) == 0)
+    return int(ids.max()), lowest, lowest + int(gaps[0]) if gaps.size else None
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    with open('input.txt', 'rb') as puzzle:
+        data = puzzle.read()
+
+    highest, _, missing = summary(seat_ids(data))
+    print('max seat_id: ', highest)
+    print('unassigned seat: ', missing)
+
+    # repeat input for measurable timing
+    big = (data + b'\n') * 2000
+    start = perf_counter()
+    ids = seat_ids(big)
+    seconds = perf_counter() - start
+    print(f'decoded {len(ids)} passes in {seconds:.3f}s, {len(ids) / seconds / 1e6:.1f}M passes/s')
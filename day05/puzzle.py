@@ -1,3 +1,6 @@
+from typing import Iterable, Optional, Tuple
+
+
 def decode(s: str):
     """
     decode 7+3 char string as row and col
@@ -66,23 +69,54 @@ def seat_id(row: int, col: int):
     return row * 8 + col
 
 
+def find_seat(passes: Iterable[str]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Find highest seat id and the first unassigned seat between the lowest and highest ids
+    in a single pass.
+    Only the running min, max and a fixed bitmap of all 1024 seat ids are kept.
+
+    >>> find_seat(["FBFBBFFRLR", "FBFBBFFRRL", "FBFBBFFRRR", "FBFBBFBLLL", "FBFBBFBLLR"])
+    (361, None)
+
+    >>> find_seat(["FBFBBFFRLR", "FBFBBFFRRR", "FBFBBFBLLL"])
+    (360, 358)
+
+    >>> find_seat(["", "\\n"])
+    (None, None)
+
+    :param passes: boarding passes, eg. file like object
+    :return: max seat id or None if there are no passes, unassigned seat id or None if there is no gap
+    """
+    seats = bytearray(1024 // 8)
+    lowest = 1024
+    highest = -1
+    for _pass in passes:
+        _pass = _pass.strip()
+        if not _pass:
+            continue
+        _id = seat_id(*decode(_pass))
+        seats[_id >> 3] |= 1 << (_id & 7)
+        lowest = min(lowest, _id)
+        highest = max(highest, _id)
+
+    unassigned = next((
+        _id
+        for _id in range(lowest + 1, highest)
+        if not seats[_id >> 3] & 1 << (_id & 7)
+    ), None)
+    return highest if highest >= 0 else None, unassigned
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
 
-    with open('input.txt', 'rt') as puzzle:
-        seat_ids = [
-            seat_id(*decode(line.strip()))
-            for line
-            in puzzle
-        ]
-
-    print('max seat_id: ', max(seat_ids))
-
     "all but one seat are full"
     "some seats in the front and in the back do not exist"
-    all_seat_ids = set(range(min(seat_ids), max(seat_ids) + 1))
-    unassigned = set(all_seat_ids).difference(seat_ids)
-    print('unassigned seat: ', unassigned.pop())
+    with open('input.txt', 'rt') as puzzle:
+        max_seat_id, unassigned = find_seat(puzzle)
+
+    print('max seat_id: ', max_seat_id)
+    print('unassigned seat: ', unassigned)
 
 
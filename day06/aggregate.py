@@ -0,0 +1,111 @@
+from typing import Iterable, List, Optional
+
+from common.records import map_records
+from day06.bitmask import all_mask, any_mask, encode, popcount
+from day06.puzzle import group_generator
+
+
+class Totals:
+    """
+    Any yes and all yes totals over groups, optionally with per question histograms:
+    how many groups had anyone / everyone answer yes to each question.
+
+    >>> totals = Totals(histograms=True)
+    >>> totals.add_group(['abc'])
+    >>> totals.add_group(['ab', 'ac'])
+    >>> totals.any_yes, totals.all_yes
+    (6, 4)
+
+    >>> totals.any_histogram[:4], totals.all_histogram[:4]
+    ([2, 2, 2, 0], [2, 1, 1, 0])
+    """
+    def __init__(self, histograms: bool = False):
+        self.any_yes = 0
+        self.all_yes = 0
+        self.any_histogram: Optional[List[int]] = [0] * 26 if histograms else None
+        self.all_histogram: Optional[List[int]] = [0] * 26 if histograms else None
+
+    def add_group(self, lines: List[str]):
+        masks = [encode(line) for line in lines]
+        _any = any_mask(masks)
+        _all = all_mask(masks)
+        self.any_yes += popcount(_any)
+        self.all_yes += popcount(_all)
+        if self.any_histogram is not None:
+            for question in range(26):
+                self.any_histogram[question] += _any >> question & 1
+                self.all_histogram[question] += _all >> question & 1
+
+    def merge(self, other: 'Totals') -> 'Totals':
+        """
+        >>> a, b = Totals(), Totals()
+        >>> a.add_group(['a'])
+        >>> b.add_group(['ab'])
+        >>> a.merge(b).any_yes
+        3
+
+        >>> try:
+        ...     a.merge(Totals(histograms=True))
+        ... except ValueError as e:
+        ...     print(e)
+        cannot merge totals with and without histograms
+
+        :raises ValueError: if only one of the totals has histograms
+        """
+        if (self.any_histogram is None) != (other.any_histogram is None):
+            raise ValueError('cannot merge totals with and without histograms')
+        self.any_yes += other.any_yes
+        self.all_yes += other.all_yes
+        if self.any_histogram is not None:
+            self.any_histogram = [a + b for a, b in zip(self.any_histogram, other.any_histogram)]
+            self.all_histogram = [a + b for a, b in zip(self.all_histogram, other.all_histogram)]
+        return self
+
+
+def aggregate(file: Iterable[str], histograms: bool = False) -> Totals:
+    """
+    Both totals in a single read.
+
+    >>> totals = aggregate(['abc', '', 'a', 'b', 'c', '', 'ab', 'ac', '', 'a', 'a', 'a', 'a', '', 'b'])
+    >>> totals.any_yes, totals.all_yes
+    (11, 6)
+
+    :param file: file like object to parse groups from
+    :param histograms: collect per question histograms too
+    :return: totals
+    """
+    totals = Totals(histograms)
+    for group in group_generator(file):
+        totals.add_group(group)
+    return totals
+
+
+def aggregate_parallel(path: str,
+                       histograms: bool = False,
+                       workers: Optional[int] = None,
+                       chunk_size: int = 1 << 22) -> Totals:
+    """
+    Aggregate chunks of a memory mapped survey file in a process pool, then merge the totals.
+    Chunks end after blank lines, see common.records.record_bounds.
+
+    :param path: of survey file
+    :param histograms: collect per question histograms too
+    :param workers: number of processes, defaults to number of cpus
+    :param chunk_size: approximate number of bytes a worker aggregates at once
+    :return: totals
+    """
+    totals = Totals(histograms)
+    for chunk_totals in map_records(aggregate, path, histograms, workers=workers, chunk_size=chunk_size):
+        totals.merge(chunk_totals)
+    return totals
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    totals = aggregate_parallel('input.txt', histograms=True, chunk_size=1 << 12)
+    print('total group any yes: ', totals.any_yes)
+    print('total group all yes: ', totals.all_yes)
+    print('any yes per question: ', totals.any_histogram)
+    print('all yes per question: ', totals.all_histogram)
@@ -0,0 +1,123 @@
+import random
+import string
+import tempfile
+from functools import reduce
+from time import perf_counter
+from typing import Iterable, Set
+
+ALL_QUESTIONS = (1 << 26) - 1
+
+_BITS = {c: 1 << idx for idx, c in enumerate(string.ascii_lowercase)}
+
+
+def encode(line: str) -> int:
+    """
+    Encode yes answers of one person as a 26 bit integer, bit 0 is question 'a'.
+    Characters other than 'a' to 'z' are not questions and are ignored.
+
+    >>> bin(encode('abd'))
+    '0b1011'
+
+    >>> bin(encode('aB d\\n'))
+    '0b1001'
+    """
+    mask = 0
+    for c in line:
+        mask |= _BITS.get(c, 0)
+    return mask
+
+
+def decode(mask: int) -> Set[str]:
+    """
+    >>> sorted(decode(0b1011))
+    ['a', 'b', 'd']
+    """
+    return {c for c, bit in _BITS.items() if mask & bit}
+
+
+def popcount(mask: int) -> int:
+    """
+    >>> popcount(0b1011)
+    3
+    """
+    return bin(mask).count('1')
+
+
+def any_mask(masks: Iterable[int]) -> int:
+    """
+    Questions anyone in the group answered yes to.
+
+    >>> bin(any_mask([encode('ab'), encode('ac')]))
+    '0b111'
+    """
+    mask = 0
+    for m in masks:
+        mask |= m
+    return mask
+
+
+def all_mask(masks: Iterable[int]) -> int:
+    """
+    Questions everyone in the group answered yes to.
+
+    >>> bin(all_mask([encode('ab'), encode('ac')]))
+    '0b1'
+
+    >>> all_mask([])
+    0
+    """
+    mask = ALL_QUESTIONS
+    empty = True
+    for m in masks:
+        mask &= m
+        empty = False
+    return 0 if empty else mask
+
+
+def _random_groups(file, groups: int):
+    for _ in range(groups):
+        for _ in range(random.randint(1, 5)):
+            file.write(''.join(random.sample(string.ascii_lowercase, random.randint(1, 26))) + '\n')
+        file.write('\n')
+
+
+def benchmark(groups: int = 200_000):
+    """
+    Time set based counting against bitmask counting on a generated group file,
+    both reading the file with group_generator.
+
+    :param groups: number of generated groups
+    """
+    from day06.puzzle import group_generator
+
+    with tempfile.TemporaryFile('w+t') as file:
+        _random_groups(file, groups)
+
+        file.seek(0)
+        start = perf_counter()
+        sets_any = 0
+        sets_all = 0
+        for lines in group_generator(file):
+            sets_any += len(set().union(*lines))
+            sets_all += len(reduce(set.intersection, [set(line) for line in lines]))
+        sets_seconds = perf_counter() - start
+
+        file.seek(0)
+        start = perf_counter()
+        masks_any = 0
+        masks_all = 0
+        for lines in group_generator(file):
+            masks = [encode(line) for line in lines]
+            masks_any += popcount(any_mask(masks))
+            masks_all += popcount(all_mask(masks))
+        masks_seconds = perf_counter() - start
+
+    assert (sets_any, sets_all) == (masks_any, masks_all)
+    print(f'{groups} groups, sets: {sets_seconds:.3f}s, bitmasks: {masks_seconds:.3f}s')
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    benchmark()
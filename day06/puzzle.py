@@ -1,6 +1,7 @@
-from functools import reduce
 from typing import Set, List
 
+from day06.bitmask import all_mask, any_mask, decode, encode
+
 
 def group_generator(file):
     """
@@ -41,14 +42,15 @@ def any_yes(lines: List[str]) -> Set[str]:
     >>> sorted(any_yes(['a', 'b']))
     ['a', 'b']
 
+    >>> sorted(any_yes(['aB']))
+    ['a']
+
     :param lines: group response
         each line marks yes responses of a single person
-    :return: set of questions to which anyone in the group reponded with yes
+    :return: set of questions to which anyone in the group reponded with yes,
+        characters other than 'a' to 'z' are ignored
     """
-    responses = set()
-    for line in lines:
-        responses = responses.union(c for c in line)
-    return responses
+    return decode(any_mask(encode(line) for line in lines))
 
 
 def all_yes(lines: List[str]):
@@ -76,30 +78,19 @@ def all_yes(lines: List[str]):
 
     :param lines: group response
         each line marks yes responses of a single person
-    :return: set of questions to which everyone in the group reponded with yes
+    :return: set of questions to which everyone in the group reponded with yes,
+        characters other than 'a' to 'z' are ignored
     """
-    responses = []
-    for line in lines:
-        responses.append(set(c for c in line))
-    return reduce(set.intersection, responses)
+    return decode(all_mask(encode(line) for line in lines))
 
 
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
 
-    with open('input.txt', 'rt') as puzzle:
-        any_counts = [
-            len(any_yes(lines))
-            for lines
-            in group_generator(puzzle)
-        ]
-    print('total group any yes: ', sum(any_counts))
+    from day06.aggregate import aggregate
 
     with open('input.txt', 'rt') as puzzle:
-        all_counts = [
-            len(all_yes(lines))
-            for lines
-            in group_generator(puzzle)
-        ]
-    print('total group all yes: ', sum(all_counts))
+        totals = aggregate(puzzle)
+    print('total group any yes: ', totals.any_yes)
+    print('total group all yes: ', totals.all_yes)
@@ -0,0 +1,220 @@
+from array import array
+from collections import deque
+from typing import Dict, Iterator, List, Set, Tuple
+
+from day07.topo import intern
+
+
+def _csr(n: int, edges: List[Tuple[int, int, int]]) -> Tuple[array, array, array]:
+    """
+    Compressed sparse rows of (source, target, weight) edges:
+    targets of node i are targets[offsets[i]:offsets[i + 1]].
+
+    >>> _csr(3, [(0, 1, 5), (0, 2, 6), (2, 1, 7)])
+    (array('i', [0, 2, 2, 3]), array('i', [1, 2, 1]), array('i', [5, 6, 7]))
+    """
+    offsets = array('i', [0] * (n + 1))
+    for source, _, _ in edges:
+        offsets[source + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+
+    targets = array('i', [0] * len(edges))
+    weights = array('i', [0] * len(edges))
+    fill = offsets[:-1]
+    for source, target, weight in edges:
+        targets[fill[source]] = target
+        weights[fill[source]] = weight
+        fill[source] += 1
+    return offsets, targets, weights
+
+
+class BagGraph:
+    """
+    Bag rules with integer bag ids and array backed adjacency, both ways:
+    contents of a bag, and containers of a bag.
+
+    >>> graph = BagGraph.from_index({
+    ...     'light red': [('bright white', 1), ('muted yellow', 2)],
+    ...     'dark orange': [('bright white', 3), ('muted yellow', 4)],
+    ...     'bright white': [('shiny gold', 1)],
+    ...     'muted yellow': [('shiny gold', 2), ('faded blue', 9)],
+    ... })
+    >>> graph.count_containers()['shiny gold']
+    4
+
+    >>> sorted(graph.containers_of('shiny gold'))
+    ['bright white', 'dark orange', 'light red', 'muted yellow']
+
+    >>> list(graph.contents(graph.ids['muted yellow']))
+    [(4, 2), (5, 9)]
+    """
+    def __init__(self,
+                 names: List[str],
+                 offsets: array, targets: array, counts: array):
+        self.names = names
+        self.ids = {name: bag_id for bag_id, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.counts = counts
+        self.rev_offsets, self.rev_targets, _ = _csr(len(names), [
+            (inner, bag, 0)
+            for bag in range(len(names))
+            for inner in targets[offsets[bag]:offsets[bag + 1]]
+        ])
+
+    @staticmethod
+    def from_index(bags: Dict[str, List[Tuple[str, int]]]) -> 'BagGraph':
+        """
+        :param bags: dict of bags, as returned by make_index_with_nums
+        """
+        names, contents = intern(bags)
+        offsets, targets, counts = _csr(len(names), [
+            (bag, inner, n)
+            for bag, inner_bags in enumerate(contents)
+            for inner, n in inner_bags
+        ])
+        return BagGraph(names, offsets, targets, counts)
+
+    def __len__(self):
+        return len(self.names)
+
+    def contents(self, bag: int) -> Iterator[Tuple[int, int]]:
+        """
+        :return: (bag id, number) pairs inside 'bag'
+        """
+        start, end = self.offsets[bag], self.offsets[bag + 1]
+        return zip(self.targets[start:end], self.counts[start:end])
+
+    def containers(self, bag: int) -> array:
+        """
+        :return: ids of bags that directly hold 'bag'
+        """
+        return self.rev_targets[self.rev_offsets[bag]:self.rev_offsets[bag + 1]]
+
+    def index_with_nums(self) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        Counted view, as returned by make_index_with_nums.
+        """
+        return {
+            name: [(self.names[inner], n) for inner, n in self.contents(bag)]
+            for bag, name in enumerate(self.names)
+        }
+
+    def index(self) -> Dict[str, List[str]]:
+        """
+        Uncounted view, as returned by make_index.
+        """
+        return {
+            name: [self.names[inner] for inner in self.targets[self.offsets[bag]:self.offsets[bag + 1]]]
+            for bag, name in enumerate(self.names)
+        }
+
+    def containers_of(self, name: str) -> Set[str]:
+        """
+        Bags that can eventually contain bag 'name', by iterative breadth first search.
+        """
+        start = self.ids[name]
+        visited = bytearray(len(self))
+        queue = deque([start])
+        while queue:
+            for container in self.containers(queue.popleft()):
+                if not visited[container]:
+                    visited[container] = 1
+                    queue.append(container)
+        return {self.names[bag] for bag, v in enumerate(visited) if v}
+
+    def _components(self) -> Iterator[List[int]]:
+        """
+        Strongly connected components along container edges, by iterative Tarjan:
+        a component comes after the components of all bags that can contain it.
+
+        >>> graph = BagGraph.from_index({'a': [('b', 1)], 'b': [('a', 1), ('c', 1)], 'c': []})
+        >>> [sorted(graph.names[bag] for bag in component) for component in graph._components()]
+        [['a', 'b'], ['c']]
+        """
+        n = len(self)
+        index = [-1] * n
+        low = [0] * n
+        on_stack = bytearray(n)
+        stack = []
+        counter = 0
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            # bag, position of its next container edge
+            work = [[root, self.rev_offsets[root]]]
+            while work:
+                frame = work[-1]
+                bag, edge = frame
+                if edge < self.rev_offsets[bag + 1]:
+                    frame[1] += 1
+                    container = self.rev_targets[edge]
+                    if index[container] == -1:
+                        index[container] = low[container] = counter
+                        counter += 1
+                        stack.append(container)
+                        on_stack[container] = 1
+                        work.append([container, self.rev_offsets[container]])
+                    elif on_stack[container]:
+                        low[bag] = min(low[bag], index[container])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[bag])
+                if low[bag] == index[bag]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == bag:
+                            break
+                    yield component
+
+    def count_containers(self) -> Dict[str, int]:
+        """
+        How many bags can eventually contain each bag.
+        Ancestors are collected as bitsets per strongly connected component, outermost first,
+        so each edge is visited once.
+        Bags that contain each other are containers of each other, and of themselves, as in containers_of.
+
+        >>> graph = BagGraph.from_index({'a': [('b', 1)], 'b': [('a', 1), ('c', 1)], 'c': []})
+        >>> graph.count_containers()
+        {'a': 2, 'b': 2, 'c': 2}
+
+        :return: number of possible containers by bag
+        """
+        ancestors = [0] * len(self)
+        for component in self._components():
+            mask = 0
+            for bag in component:
+                for container in self.containers(bag):
+                    # containers in the same component are not done yet, but are ancestors of each other
+                    mask |= ancestors[container] | 1 << container
+            for bag in component:
+                ancestors[bag] = mask
+        return {
+            name: bin(mask).count('1')
+            for name, mask in zip(self.names, ancestors)
+        }
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    from day07.puzzle import make_index_with_nums
+
+    with open('input.txt', 'rt') as puzzle:
+        graph = BagGraph.from_index(make_index_with_nums(puzzle))
+
+    containers = graph.count_containers()
+    print('number of kinds of bags that can eventually contain a _shiny gold_ bag:', containers['shiny gold'])
+    print('bag that can be put in most other bags:', max(containers, key=containers.get))
@@ -0,0 +1,243 @@
+import random
+from collections import defaultdict, deque
+from time import perf_counter
+from typing import Callable, Dict, FrozenSet, Iterable, List, Set, Tuple
+
+from day07.csr import BagGraph
+from day07.topo import CycleError, count_all_inwards
+
+
+def _drop_cached(start: Iterable[str], neighbors: Callable[[str], Iterable[str]], cache: dict):
+    """
+    Drop cached values of 'start' and of every bag reachable from it through cached bags, iteratively.
+    A value is only cached after the values it depends on,
+    so nothing beyond an uncached bag can be cached.
+
+    >>> cache = {'a': 1, 'b': 2, 'd': 4}
+    >>> _drop_cached(['a'], {'a': ['b'], 'b': ['c'], 'c': ['d']}.__getitem__, cache)
+    >>> cache
+    {'d': 4}
+    """
+    stack = [bag for bag in start if cache.pop(bag, None) is not None]
+    while stack:
+        for bag in neighbors(stack.pop()):
+            if cache.pop(bag, None) is not None:
+                stack.append(bag)
+
+
+def _find_cycle(start: str, neighbors: Callable[[str], Iterable[str]], within: Set[str]) -> List[str]:
+    """
+    Shortest path from 'start' back to itself, through bags in 'within'.
+
+    >>> _find_cycle('a', {'a': ['b'], 'b': ['c', 'a'], 'c': []}.__getitem__, {'a', 'b', 'c'})
+    ['a', 'b', 'a']
+    """
+    parents = {}
+    queue = deque([start])
+    while queue:
+        bag = queue.popleft()
+        for neighbor in neighbors(bag):
+            if neighbor == start:
+                cycle = [start, bag]
+                while cycle[-1] != start:
+                    cycle.append(parents[cycle[-1]])
+                return cycle[::-1]
+            if neighbor in within and neighbor not in parents:
+                parents[neighbor] = bag
+                queue.append(neighbor)
+    return [start, start]
+
+
+class IncrementalBagGraph:
+    """
+    Bag rules with cached containers and inner bag counts.
+    Changing a rule only drops the cached values it can affect,
+    they are recomputed on the next query.
+    Updates cost in proportion to the number of cached values dropped.
+
+    >>> graph = IncrementalBagGraph({
+    ...     'light red': [('bright white', 1), ('muted yellow', 2)],
+    ...     'bright white': [('shiny gold', 1)],
+    ...     'muted yellow': [('shiny gold', 2)],
+    ...     'shiny gold': [('dark red', 2)],
+    ... })
+    >>> sorted(graph.containers_of('shiny gold')), graph.count_inwards('shiny gold')
+    (['bright white', 'light red', 'muted yellow'], 2)
+
+    >>> graph.set_rule('shiny gold', [('dark red', 3)])
+    >>> graph.count_inwards('light red')
+    23
+
+    >>> graph.remove_rule('muted yellow')
+    >>> sorted(graph.containers_of('shiny gold')), graph.count_inwards('light red')
+    (['bright white', 'light red'], 7)
+    """
+    def __init__(self, bags: Dict[str, List[Tuple[str, int]]] = None):
+        self.contents: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self.containers: Dict[str, Set[str]] = defaultdict(set)
+        self._ancestors: Dict[str, FrozenSet[str]] = {}
+        self._inner: Dict[str, int] = {}
+        # nothing is cached yet, so there is nothing to drop
+        for bag, inner_bags in (bags or {}).items():
+            self.contents[bag] = dict(inner_bags)
+            for inner, _ in inner_bags:
+                self.contents.setdefault(inner, {})
+                self.containers[inner].add(bag)
+
+    def set_rule(self, bag: str, inner_bags: List[Tuple[str, int]]):
+        """
+        Add or replace the rule of 'bag'.
+
+        :param bag: outer bag
+        :param inner_bags: list of (bag, number) inside outer bag
+        """
+        old = self.contents[bag]
+        new = dict(inner_bags)
+
+        # inner counts of the bag and everything around it
+        _drop_cached([bag], self.containers.__getitem__, self._inner)
+
+        # containers of old and new inner bags, and of everything inside them, before and after
+        changed = old.keys() ^ new.keys()
+        _drop_cached(changed, self.contents.__getitem__, self._ancestors)
+
+        for inner in old.keys() - new.keys():
+            self.containers[inner].discard(bag)
+        for inner in new.keys() - old.keys():
+            self.contents.setdefault(inner, {})
+            self.containers[inner].add(bag)
+        self.contents[bag] = new
+
+        _drop_cached(changed, self.contents.__getitem__, self._ancestors)
+
+    def remove_rule(self, bag: str):
+        self.set_rule(bag, [])
+
+    def _memoized(self, bag: str, cache: dict, dependencies: Callable[[str], Iterable[str]], compute: Callable[[str], object]):
+        """
+        Evaluate 'compute' for 'bag' after all its uncached 'dependencies', depth first without recursion.
+
+        :raises CycleError: if bags contain each other
+        """
+        stack = [bag]
+        in_progress = set()
+        while stack:
+            current = stack[-1]
+            if current in cache:
+                stack.pop()
+                continue
+            pending = [dep for dep in dependencies(current) if dep not in cache]
+            if not pending or current in in_progress:
+                if pending:
+                    raise CycleError(_find_cycle(current, dependencies, in_progress))
+                cache[current] = compute(current)
+                in_progress.discard(current)
+                stack.pop()
+            else:
+                in_progress.add(current)
+                stack.extend(pending)
+        return cache[bag]
+
+    def containers_of(self, bag: str) -> FrozenSet[str]:
+        """
+        :return: bags that can eventually contain 'bag', frozen as it is shared with the cache
+        """
+        def _compute(current):
+            ancestors = set(self.containers[current])
+            for container in self.containers[current]:
+                ancestors |= self._ancestors[container]
+            return frozenset(ancestors)
+
+        return self._memoized(bag, self._ancestors, self.containers.__getitem__, _compute)
+
+    def count_inwards(self, bag: str) -> int:
+        """
+        :return: number of bags inside 'bag'
+        """
+        def _compute(current):
+            return sum(n + n * self._inner[inner] for inner, n in self.contents[current].items())
+
+        return self._memoized(bag, self._inner, self.contents.__getitem__, _compute)
+
+
+def chain(length: int) -> Dict[str, List[Tuple[str, int]]]:
+    """
+    Rules of bags nested in a single line, the deepest possible rule set.
+
+    >>> chain(3)
+    {'bag 0': [('bag 1', 1)], 'bag 1': [('bag 2', 1)], 'bag 2': []}
+    """
+    return {
+        f'bag {i}': [(f'bag {i + 1}', 1)] if i + 1 < length else []
+        for i in range(length)
+    }
+
+
+def _time_updates(name: str, index: Dict[str, List[Tuple[str, int]]], updates: int):
+    start = perf_counter()
+    graph = IncrementalBagGraph(index)
+    bags = list(graph.contents)
+    for bag in bags:
+        graph.containers_of(bag)
+        graph.count_inwards(bag)
+    build = perf_counter() - start
+
+    start = perf_counter()
+    BagGraph.from_index(index).count_containers()
+    count_all_inwards(index)
+    full_build = perf_counter() - start
+    print(f'{name}, {len(bags)} bags, incremental build: {build:.3f}s, full build: {full_build:.3f}s')
+
+    rules = {bag: list(inner_bags) for bag, inner_bags in index.items()}
+    incremental = 0.0
+    rebuild = 0.0
+    for _ in range(updates):
+        bag = random.choice([bag for bag, inner_bags in rules.items() if inner_bags])
+        inner_bags = [(inner, random.randint(1, 5)) for inner, _ in rules[bag]]
+        rules[bag] = inner_bags
+
+        start = perf_counter()
+        graph.set_rule(bag, inner_bags)
+        for b in bags:
+            graph.containers_of(b)
+            graph.count_inwards(b)
+        incremental += perf_counter() - start
+
+        start = perf_counter()
+        BagGraph.from_index(rules).count_containers()
+        count_all_inwards(rules)
+        rebuild += perf_counter() - start
+
+    print(f'{name}, {updates} updates, incremental: {incremental / updates * 1e3:.3f}ms/update, '
+          f'full rebuild: {rebuild / updates * 1e3:.3f}ms/update')
+
+
+def benchmark(index: Dict[str, List[Tuple[str, int]]], updates: int = 100, chain_length: int = 2000):
+    """
+    Time building the graph and answering both questions for every bag,
+    then changing the number of one kind of inner bag in a random rule and answering again,
+    incrementally and with full rebuild.
+    Runs on 'index', then on a chain of bags.
+
+    :param index: dict of bags, as returned by make_index_with_nums
+    :param updates: number of rule changes
+    :param chain_length: number of bags in chain
+    """
+    _time_updates('rules', index, updates)
+    _time_updates('chain', chain(chain_length), updates)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    from day07.puzzle import make_index_with_nums
+
+    with open('input.txt', 'rt') as puzzle:
+        index = make_index_with_nums(puzzle)
+
+    graph = IncrementalBagGraph(index)
+    print('number of kinds of bags that can eventually contain a _shiny gold_ bag:', len(graph.containers_of('shiny gold')))
+    print('number of bags inside a _shiny gold_ bag: ', graph.count_inwards('shiny gold'))
+
+    benchmark(index)
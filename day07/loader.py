@@ -0,0 +1,116 @@
+import os
+import struct
+from array import array
+from typing import BinaryIO, Iterable
+
+from day07.csr import BagGraph
+from day07.puzzle import parse_sentence
+
+MAGIC = b'BAGS'
+# magic, item size of arrays, number of bags, number of rules, length of names
+HEADER = struct.Struct('<4sBIII')
+
+
+def load_rules(file: Iterable[str]) -> BagGraph:
+    """
+    Parse every sentence exactly once into a graph that serves both the counted and uncounted views.
+
+    >>> graph = load_rules([
+    ...     "light red bags contain 1 bright white bag, 2 muted yellow bags.",
+    ...     "bright white bags contain 1 shiny gold bag.",
+    ...     "faded blue bags contain no other bags.",
+    ... ])
+    >>> graph.index()['light red']
+    ['bright white', 'muted yellow']
+
+    >>> graph.index_with_nums()['light red']
+    [('bright white', 1), ('muted yellow', 2)]
+
+    :param file: of all the sentences
+    :return: graph of bags
+    """
+    return BagGraph.from_index(dict(
+        parse_sentence(sentence)
+        for sentence in file
+        if sentence.strip()
+    ))
+
+
+def dump(graph: BagGraph, file: BinaryIO):
+    """
+    Write graph in binary form: header, newline separated names, then the raw arrays.
+
+    >>> from io import BytesIO
+    >>> graph = load_rules(["light red bags contain 1 bright white bag, 2 muted yellow bags."])
+    >>> buffer = BytesIO()
+    >>> dump(graph, buffer)
+    >>> _ = buffer.seek(0)
+    >>> load(buffer).index_with_nums() == graph.index_with_nums()
+    True
+    """
+    names = '\n'.join(graph.names).encode()
+    file.write(HEADER.pack(MAGIC, graph.offsets.itemsize, len(graph.names), len(graph.targets), len(names)))
+    file.write(names)
+    for arr in (graph.offsets, graph.targets, graph.counts):
+        arr.tofile(file)
+
+
+def load(file: BinaryIO) -> BagGraph:
+    """
+    Read graph written by dump.
+
+    :raises ValueError: if file is not a bag graph of this platform
+    """
+    magic, itemsize, bags, rules, names_length = HEADER.unpack(file.read(HEADER.size))
+    if magic != MAGIC or itemsize != array('i').itemsize:
+        raise ValueError('not a bag graph cache')
+    names = file.read(names_length).decode().split('\n') if bags else []
+
+    offsets, targets, counts = array('i'), array('i'), array('i')
+    offsets.fromfile(file, bags + 1)
+    targets.fromfile(file, rules)
+    counts.fromfile(file, rules)
+    return BagGraph(names, offsets, targets, counts)
+
+
+def load_cached(path: str, cache_path: str = None) -> BagGraph:
+    """
+    Load rules from binary cache, if it is newer than the rules, otherwise parse rules and refresh cache.
+
+    :param path: of rule sentences
+    :param cache_path: of binary cache, defaults to path + '.cache'
+    :return: graph of bags
+    """
+    cache_path = cache_path or path + '.cache'
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+        with open(cache_path, 'rb') as cache:
+            try:
+                return load(cache)
+            except (ValueError, EOFError, struct.error):
+                pass
+
+    with open(path, 'rt') as rules:
+        graph = load_rules(rules)
+    with open(cache_path, 'wb') as cache:
+        dump(graph, cache)
+    return graph
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    from time import perf_counter
+
+    start = perf_counter()
+    with open('input.txt', 'rt') as puzzle:
+        graph = load_rules(puzzle)
+    print(f'parsed in {perf_counter() - start:.4f}s')
+
+    with open('input.txt.cache', 'wb') as cache:
+        dump(graph, cache)
+    start = perf_counter()
+    with open('input.txt.cache', 'rb') as cache:
+        load(cache)
+    print(f'loaded from cache in {perf_counter() - start:.4f}s')
+    os.remove('input.txt.cache')
@@ -157,14 +157,13 @@ if __name__ == '__main__':
     import doctest
     doctest.testmod()
 
+    from day07.loader import load_rules
+
     with open('input.txt', 'rt') as puzzle:
-        inverted_index = invert_index(make_index(puzzle))
+        graph = load_rules(puzzle)
 
-    v = traverse_outwards(bags=inverted_index, start='shiny gold')
+    v = traverse_outwards(bags=invert_index(graph.index()), start='shiny gold')
     print('number of kinds of bags that can eventually contain a _shiny gold_ bag:', len(v))
 
-    with open('input.txt', 'rt') as puzzle:
-        index = make_index_with_nums(puzzle)
-
-    bags_inside = count_inwards(bags=index, start='shiny gold')
+    bags_inside = count_inwards(bags=graph.index_with_nums(), start='shiny gold')
     print('number of bags inside a _shiny gold_ bag: ', bags_inside)
@@ -0,0 +1,127 @@
+from collections import deque
+from typing import Dict, List, Tuple
+
+
+class CycleError(ValueError):
+    """
+    Bags contain each other in a cycle, there is no finite number of bags inside them.
+    """
+    def __init__(self, cycle: List[str]):
+        super().__init__(f'bags contain each other: {" -> ".join(cycle)}')
+        self.cycle = cycle
+
+
+def intern(bags: Dict[str, List[Tuple[str, int]]]) -> Tuple[List[str], List[List[Tuple[int, int]]]]:
+    """
+    Replace bag names with integer ids.
+
+    >>> intern({'a': [('b', 1), ('c', 2)]})
+    (['a', 'b', 'c'], [[(1, 1), (2, 2)], [], []])
+
+    :param bags: dict of bags, as in count_inwards
+    :return: names by id, list of (id, number) contents by id
+    """
+    ids: Dict[str, int] = {}
+    contents: List[List[Tuple[int, int]]] = []
+
+    def _id(name: str) -> int:
+        if name not in ids:
+            ids[name] = len(ids)
+            contents.append([])
+        return ids[name]
+
+    for bag, inner_bags in bags.items():
+        bag_id = _id(bag)
+        contents[bag_id] = [(_id(inner), n) for inner, n in inner_bags]
+
+    names = [''] * len(ids)
+    for name, bag_id in ids.items():
+        names[bag_id] = name
+    return names, contents
+
+
+def inside_out_order(names: List[str], contents: List[List[Tuple[int, int]]]) -> List[int]:
+    """
+    Order bags so that every bag comes after all the bags it contains.
+
+    >>> inside_out_order(['a', 'b', 'c'], [[(1, 1), (2, 2)], [(2, 1)], []])
+    [2, 1, 0]
+
+    >>> try:
+    ...     inside_out_order(['a', 'b', 'c', 'd'], [[(1, 1)], [(2, 1)], [(1, 1)], []])
+    ... except CycleError as e:
+    ...     print(e)
+    bags contain each other: b -> c -> b
+
+    :param names: bag names by id
+    :param contents: list of (id, number) contents by id
+    :return: bag ids
+    :raises CycleError: if bags contain each other
+    """
+    containers: List[List[int]] = [[] for _ in contents]
+    pending = [0] * len(contents)
+    for bag, inner_bags in enumerate(contents):
+        for inner, _ in inner_bags:
+            containers[inner].append(bag)
+            pending[bag] += 1
+
+    ready = deque(bag for bag, p in enumerate(pending) if p == 0)
+    order = []
+    while ready:
+        bag = ready.popleft()
+        order.append(bag)
+        for container in containers[bag]:
+            pending[container] -= 1
+            if pending[container] == 0:
+                ready.append(container)
+
+    if len(order) < len(contents):
+        # every bag left over contains another left over bag: follow them until one repeats
+        bag = next(bag for bag, p in enumerate(pending) if p)
+        path = []
+        seen = {}
+        while bag not in seen:
+            seen[bag] = len(path)
+            path.append(bag)
+            bag = next(inner for inner, _ in contents[bag] if pending[inner])
+        raise CycleError([names[b] for b in path[seen[bag]:]] + [names[bag]])
+
+    return order
+
+
+def count_all_inwards(bags: Dict[str, List[Tuple[str, int]]]) -> Dict[str, int]:
+    """
+    How many bags are inside each bag, in a single pass over the bags.
+
+    >>> count_all_inwards({
+    ...         'shiny gold': [('dark red', 2)],
+    ...         'dark red': [('dark orange', 2)],
+    ...         'dark orange': [('dark yellow', 2)],
+    ...         'dark yellow': [('dark green', 2)],
+    ...         'dark green': [('dark blue', 2)],
+    ...         'dark blue': [('dark violet', 2)],
+    ...     })['shiny gold']
+    126
+
+    :param bags: dict of bags, as in count_inwards
+    :return: number of bags inside, by bag
+    :raises CycleError: if bags contain each other
+    """
+    names, contents = intern(bags)
+    counts = [0] * len(names)
+    for bag in inside_out_order(names, contents):
+        counts[bag] = sum(n + n * counts[inner] for inner, n in contents[bag])
+    return dict(zip(names, counts))
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    from day07.puzzle import make_index_with_nums
+
+    with open('input.txt', 'rt') as puzzle:
+        index = make_index_with_nums(puzzle)
+
+    bags_inside = count_all_inwards(index)
+    print('number of bags inside a _shiny gold_ bag: ', bags_inside['shiny gold'])
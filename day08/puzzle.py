@@ -1,5 +1,7 @@
 from enum import Enum
-from typing import Tuple, List
+from typing import Tuple, List, Optional
+
+from day08.trace import Trace
 
 
 class Op(Enum):
@@ -11,11 +13,13 @@ class Op(Enum):
 class Cpu:
     def __init__(self,
                  program: List[Tuple[Op, int]],
-                 acc_init: int = 0
+                 acc_init: int = 0,
+                 trace: Optional[Trace] = None
                  ):
         self.accumulator = acc_init
         self.program = program
         self.pc = 0
+        self.trace = trace
 
     def step(self, pc) -> int:
         """
@@ -37,15 +41,33 @@ class Cpu:
     def run_detect_loop(self):
         """
         run program until pc is visited twice.
+        if the cpu has a trace, every executed instruction is recorded in it.
+
+        >>> program = [parse_line(line) for line in ["nop +0", "acc +1", "jmp +4", "acc +3", "jmp -3",
+        ...                                          "acc -99", "acc +1", "jmp -4", "acc +6"]]
+        >>> cpu = Cpu(program, trace=Trace(len(program)))
+        >>> cpu.run_detect_loop()
+        5
+        >>> list(cpu.trace.executions), list(cpu.trace.jump_targets)
+        ([1, 1, 1, 1, 1, 0, 1, 1, 0], [-1, -1, 6, -1, 1, -1, -1, 3, -1])
 
         :return: accumulator value before duplicate execution
         """
         history = set()
         acc = 0
+        if self.trace is None:
+            while self.pc not in history:
+                acc = self.accumulator
+                history.add(self.pc)
+                self.pc = self.step(self.pc)
+            return acc
+
         while self.pc not in history:
             acc = self.accumulator
             history.add(self.pc)
-            self.pc = self.step(self.pc)
+            pc = self.pc
+            self.pc = self.step(pc)
+            self.trace.record(pc, self.accumulator - acc, self.pc)
 
         return acc
 
@@ -0,0 +1,82 @@
+import csv
+from array import array
+from typing import BinaryIO, List, TextIO, Tuple
+
+
+class Trace:
+    """
+    Execution profile of a program, per program counter, in preallocated arrays.
+
+    >>> trace = Trace(3)
+    >>> trace.record(0, 0, 1)
+    >>> trace.record(1, 5, 2)
+    >>> trace.record(1, 5, 0)
+    >>> list(trace.executions), list(trace.acc_deltas), list(trace.jump_targets)
+    ([1, 2, 0], [0, 10, 0], [-1, 0, -1])
+
+    >>> trace.hot(1)
+    [(1, 2)]
+    """
+    def __init__(self, size: int):
+        self.executions = array('q', bytes(8 * size))
+        self.acc_deltas = array('q', bytes(8 * size))
+        self.jump_targets = array('q', [-1]) * size
+
+    def record(self, pc: int, acc_delta: int, next_pc: int):
+        """
+        :param pc: executed instruction
+        :param acc_delta: change of accumulator by the instruction
+        :param next_pc: instruction executed next, recorded if it is not pc + 1
+        """
+        self.executions[pc] += 1
+        self.acc_deltas[pc] += acc_delta
+        if next_pc != pc + 1:
+            self.jump_targets[pc] = next_pc
+
+    def hot(self, n: int = 10) -> List[Tuple[int, int]]:
+        """
+        :return: 'n' most executed instructions as (pc, executions)
+        """
+        return sorted(enumerate(self.executions), key=lambda e: -e[1])[:n]
+
+    def to_csv(self, file: TextIO):
+        """
+        >>> from io import StringIO
+        >>> trace = Trace(2)
+        >>> trace.record(0, 3, 1)
+        >>> out = StringIO()
+        >>> trace.to_csv(out)
+        >>> print(out.getvalue().replace('\\r', ''), end='')
+        pc,executions,acc_delta,jump_target
+        0,1,3,-1
+        1,0,0,-1
+        """
+        writer = csv.writer(file)
+        writer.writerow(['pc', 'executions', 'acc_delta', 'jump_target'])
+        writer.writerows(
+            (pc, *row)
+            for pc, row in enumerate(zip(self.executions, self.acc_deltas, self.jump_targets))
+        )
+
+    def to_binary(self, file: BinaryIO):
+        """
+        Write the three arrays one after the other, native 64 bit integers.
+        """
+        for arr in (self.executions, self.acc_deltas, self.jump_targets):
+            arr.tofile(file)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    import sys
+    from day08.puzzle import Cpu, parse_line
+
+    with open('input.txt', 'rt') as puzzle:
+        program = [parse_line(line) for line in puzzle]
+
+    cpu = Cpu(program, trace=Trace(len(program)))
+    cpu.run_detect_loop()
+    print('hot instructions (pc, executions): ', cpu.trace.hot(5))
+    cpu.trace.to_csv(sys.stdout)
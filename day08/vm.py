@@ -0,0 +1,169 @@
+from array import array
+from time import perf_counter
+from typing import Iterable, List, Optional, Tuple
+
+from day08.puzzle import Op, parse_line
+
+ACC, JMP, NOP = range(3)
+OPCODES = {Op.ACC: ACC, Op.JMP: JMP, Op.NOP: NOP}
+
+# handlers by opcode: (pc, acc, arg) -> (next pc, next acc)
+DISPATCH = (
+    lambda pc, acc, arg: (pc + 1, acc + arg),
+    lambda pc, acc, arg: (pc + arg, acc),
+    lambda pc, acc, arg: (pc + 1, acc),
+)
+
+
+class Vm:
+    """
+    Handheld console with the program in parallel arrays of opcodes and operands.
+
+    >>> vm = Vm.parse(["nop +0", "acc +1", "jmp +4", "acc +3", "jmp -3",
+    ...                "acc -99", "acc +1", "jmp -4", "acc +6"])
+    >>> vm.run_detect_loop()
+    5
+
+    >>> vm.repair()
+    8
+    """
+    def __init__(self, program: List[Tuple[Op, int]]):
+        self.ops = array('b', (OPCODES[op] for op, _ in program))
+        self.args = array('i', (arg for _, arg in program))
+
+    @staticmethod
+    def parse(file: Iterable[str]) -> 'Vm':
+        return Vm([parse_line(line) for line in file if line.strip()])
+
+    def __len__(self):
+        return len(self.ops)
+
+    def run(self) -> Tuple[bool, int]:
+        """
+        Run program until it steps right after its last instruction, or an instruction repeats.
+
+        :return: True if program terminated, accumulator value
+        """
+        ops, args = self.ops, self.args
+        end = len(ops)
+        visited = bytearray(end)
+        pc = 0
+        acc = 0
+        while 0 <= pc < end and not visited[pc]:
+            visited[pc] = 1
+            pc, acc = DISPATCH[ops[pc]](pc, acc, args[pc])
+        return pc == end, acc
+
+    def run_detect_loop(self) -> int:
+        """
+        :return: accumulator value before any instruction is executed a second time
+        """
+        _, acc = self.run()
+        return acc
+
+    def repair(self) -> Optional[int]:
+        """
+        Switch jmp and nop instructions one at a time, until the program terminates.
+
+        :return: accumulator value of the repaired program, None if there is no repair
+        """
+        swap = {JMP: NOP, NOP: JMP}
+        for pc, op in enumerate(self.ops):
+            if op not in swap:
+                continue
+            self.ops[pc] = swap[op]
+            terminated, acc = self.run()
+            self.ops[pc] = op
+            if terminated:
+                return acc
+        return None
+
+    def _terminating(self) -> bytearray:
+        """
+        Mark instructions from which the unchanged program terminates,
+        by walking backwards from the position right after the last instruction.
+
+        >>> list(Vm.parse(["nop +0", "jmp -1", "acc +1"])._terminating())
+        [0, 0, 1, 1]
+        """
+        end = len(self.ops)
+        # sources[target] lists every pc whose next pc is target
+        sources: List[List[int]] = [[] for _ in range(end + 1)]
+        for pc in range(end):
+            next_pc = pc + self.args[pc] if self.ops[pc] == JMP else pc + 1
+            if 0 <= next_pc <= end:
+                sources[next_pc].append(pc)
+
+        terminating = bytearray(end + 1)
+        terminating[end] = 1
+        stack = [end]
+        while stack:
+            for pc in sources[stack.pop()]:
+                if not terminating[pc]:
+                    terminating[pc] = 1
+                    stack.append(pc)
+        return terminating
+
+    def repair_linear(self) -> Optional[int]:
+        """
+        Find the jmp or nop to switch in O(n):
+        run the program once, and switch the first executed instruction
+        that lands on an instruction from which the program terminates.
+
+        >>> Vm.parse(["nop +0", "acc +1", "jmp +4", "acc +3", "jmp -3",
+        ...           "acc -99", "acc +1", "jmp -4", "acc +6"]).repair_linear()
+        8
+
+        :return: accumulator value of the repaired program, None if there is no repair
+        """
+        ops, args = self.ops, self.args
+        end = len(ops)
+        terminating = self._terminating()
+        if terminating[0]:
+            # nothing to repair
+            return self.run()[1]
+        visited = bytearray(end)
+        pc = 0
+        acc = 0
+        repaired = False
+        while 0 <= pc < end and not visited[pc]:
+            visited[pc] = 1
+            op = ops[pc]
+            if not repaired and op != ACC:
+                switched = pc + 1 if op == JMP else pc + args[pc]
+                if 0 <= switched <= end and terminating[switched]:
+                    repaired = True
+                    pc = switched
+                    continue
+            pc, acc = DISPATCH[op](pc, acc, args[pc])
+        return acc if pc == end else None
+
+
+def benchmark(size: int = 2_000_000):
+    """
+    Instructions per second on a generated program that executes every instruction once.
+
+    :param size: number of instructions
+    """
+    program = [
+        (Op.ACC, 1) if i % 3 == 0 else (Op.NOP, 0) if i % 3 == 1 else (Op.JMP, 1)
+        for i in range(size)
+    ]
+    vm = Vm(program)
+    start = perf_counter()
+    vm.run()
+    seconds = perf_counter() - start
+    print(f'{size} instructions in {seconds:.3f}s, {size / seconds / 1e6:.2f}M instructions/s')
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    with open('input.txt', 'rt') as puzzle:
+        vm = Vm.parse(puzzle)
+
+    print('accumulator before 2nd execution of same line: ', vm.run_detect_loop())
+    print('Accumulator value after program finished: ', vm.repair_linear())
+
+    benchmark()
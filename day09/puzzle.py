@@ -1,4 +1,6 @@
-from typing import List
+from collections import Counter, deque
+from itertools import islice
+from typing import Iterable, List, Optional, Sequence
 
 
 def batch_generator(numbers: List[int], preamble_size: int = 25):
@@ -54,6 +56,43 @@ def has_sum_of_n_elements(numbers: List[int],
            has_sum_of_n_elements(tail, target, max_num)
 
 
+def first_invalid(numbers: Iterable[int], preamble_size: int = 25) -> Optional[int]:
+    """
+    Find first number that is not the sum of two of the 'preamble_size' numbers before it.
+    The window is kept as a multiset of value -> count, so each number is checked in O(preamble_size),
+    and memory does not grow with the length of the stream.
+
+    >>> first_invalid([35, 20, 15, 25, 47, 40, 62, 55, 65, 95, 102, 117, 150, 182, 127, 219], 5)
+    127
+
+    >>> first_invalid([1, 2, 3, 4, 5, 7], 3) is None
+    True
+
+    >>> first_invalid([5, 5, 10, 20], 2)
+    20
+
+    :param numbers: stream of numbers
+    :param preamble_size: size of sliding window
+    :return: first invalid number, None if all are valid
+    """
+    window = deque()
+    counts = Counter()
+    for num in numbers:
+        if len(window) == preamble_size:
+            if not any(
+                    num - value in counts and (num - value != value or count > 1)
+                    for value, count in counts.items()
+            ):
+                return num
+            oldest = window.popleft()
+            counts[oldest] -= 1
+            if not counts[oldest]:
+                del counts[oldest]
+        window.append(num)
+        counts[num] += 1
+    return None
+
+
 def contiguous_range_with_sum(
         numbers: List[int],
         target: int,
@@ -80,6 +119,88 @@ def contiguous_range_with_sum(
     return []
 
 
+def _min_plus_max(numbers: Sequence[int], start: int, end: int) -> int:
+    """
+    >>> _min_plus_max([9, 2, 3, 4, 9], 1, 4)
+    6
+    """
+    _min = _max = numbers[start]
+    for num in islice(numbers, start + 1, end):
+        if num < _min:
+            _min = num
+        elif num > _max:
+            _max = num
+    return _min + _max
+
+
+def range_min_max_two_pointers(numbers: Sequence[int],
+                               target: int,
+                               min_length: int = 2) -> Optional[int]:
+    """
+    Find contiguous range of non-negative 'numbers' of at least 'min_length' that sums to 'target',
+    by moving the end of the range forward, and its start forward while the sum is too large.
+
+    >>> range_min_max_two_pointers([35, 20, 15, 25, 47, 40, 62, 55, 65, 95, 102, 117, 150, 182, 127], 127)
+    62
+
+    >>> range_min_max_two_pointers([1, 2, 3, 4, 5, 6], 50) is None
+    True
+
+    :param numbers: non-negative numbers
+    :param target: sum of range
+    :param min_length: minimum number of elements in range
+    :return: smallest + largest element of range, None if there is no such range
+    """
+    start = 0
+    total = 0
+    for end, num in enumerate(numbers, start=1):
+        total += num
+        while total > target and end - start > 1:
+            total -= numbers[start]
+            start += 1
+        if total == target and end - start >= min_length:
+            return _min_plus_max(numbers, start, end)
+    return None
+
+
+def range_min_max_prefix_sums(numbers: Sequence[int],
+                              target: int,
+                              min_length: int = 2) -> Optional[int]:
+    """
+    Find contiguous range of 'numbers' of at least 'min_length' that sums to 'target',
+    also if there are negative numbers:
+    a range sums to 'target' if prefix sum at its end - 'target' was a prefix sum before its start.
+
+    >>> range_min_max_prefix_sums([35, 20, 15, 25, 47, 40, 62, 55, 65, 95, 102, 117, 150, 182, 127], 127)
+    62
+
+    >>> range_min_max_prefix_sums([5, -3, 4, -1, 2], 3)
+    3
+
+    >>> range_min_max_prefix_sums([1, 2, 3], 50) is None
+    True
+
+    :param numbers: any numbers
+    :param target: sum of range
+    :param min_length: minimum number of elements in range
+    :return: smallest + largest element of range, None if there is no such range
+    """
+    # earliest index of each prefix sum, that is at least 'min_length' before the current end
+    starts = {}
+    # prefix sums not yet old enough to be in 'starts'
+    recent = deque([0])
+    total = 0
+    for end, num in enumerate(numbers, start=1):
+        total += num
+        if len(recent) == min_length:
+            starts.setdefault(recent.popleft(), end - min_length)
+        recent.append(total)
+        start = starts.get(total - target)
+        if start is not None:
+            return _min_plus_max(numbers, start, end)
+    return None
+
+
 if __name__ == '__main__':
     import doctest
 
@@ -91,14 +212,9 @@ if __name__ == '__main__':
             for line in puzzle
         ]
 
-    has_no_sum = next((
-        num
-        for preamble, num in batch_generator(numbers)
-        if not has_sum_of_n_elements(preamble, num)
-    ))
+    has_no_sum = first_invalid(numbers)
 
     print('First number that has no sum in its preamble:', has_no_sum)
 
-    contiguous_range = contiguous_range_with_sum(numbers=numbers, target=has_no_sum)
-    min_max_sum = min(contiguous_range) + max(contiguous_range)
+    min_max_sum = range_min_max_two_pointers(numbers=numbers, target=has_no_sum)
     print(f'_min_ + _max_ of contiguous range that sums to {has_no_sum}: {min_max_sum}')
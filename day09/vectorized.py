@@ -0,0 +1,170 @@
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+try:
+    import numpy as np
+except ImportError:  # optional backend
+    np = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError('the vectorized backend needs numpy: pip install numpy')
+
+
+def read_blocks(file: Iterable[str], block_size: int = 1 << 12) -> Iterator['np.ndarray']:
+    """
+    Parse numbers, at most 'block_size' at a time.
+
+    >>> [block.tolist() for block in read_blocks(['1', '2', '3'], 2)]
+    [[1, 2], [3]]
+    """
+    _require_numpy()
+    lines = iter(file)
+    while True:
+        block = np.fromiter(map(int, islice(lines, block_size)), dtype=np.int64)
+        if not block.size:
+            return
+        yield block
+
+
+def first_invalid(blocks: Iterable['np.ndarray'], preamble_size: int = 25) -> Optional[int]:
+    """
+    Find first number that is not the sum of two of the 'preamble_size' numbers before it.
+    All pairwise sums of the preambles of a block are compared at once,
+    which takes block size * preamble_size ** 2 integers of memory.
+
+    >>> blocks = read_blocks(['35', '20', '15', '25', '47', '40', '62', '55', '65', '95',
+    ...                       '102', '117', '150', '182', '127', '219'], 4)
+    >>> first_invalid(blocks, 5)
+    127
+
+    :param blocks: of numbers
+    :param preamble_size: size of sliding window
+    :return: first invalid number, None if all are valid
+    """
+    _require_numpy()
+    # pairs of distinct positions in the preamble
+    pairs = np.triu(np.ones((preamble_size, preamble_size), dtype=bool), 1)
+    carry = np.empty(0, dtype=np.int64)
+    for block in blocks:
+        numbers = np.concatenate((carry, block))
+        if len(numbers) > preamble_size:
+            # sliding windows as a view, as_strided works before numpy 1.20 added sliding_window_view
+            step = numbers.strides[0]
+            preambles = np.lib.stride_tricks.as_strided(
+                numbers, shape=(len(numbers) - preamble_size, preamble_size), strides=(step, step), writeable=False)
+            targets = numbers[preamble_size:]
+            sums = preambles[:, :, None] + preambles[:, None, :]
+            valid = ((sums == targets[:, None, None]) & pairs).any(axis=(1, 2))
+            invalid = np.flatnonzero(~valid)
+            if invalid.size:
+                return int(targets[invalid[0]])
+        carry = numbers[-preamble_size:]
+    return None
+
+
+def _start_prefix(block: 'np.ndarray', before: int) -> 'np.ndarray':
+    """
+    Sum of numbers before each number of 'block', given the sum 'before' the block.
+    """
+    return before + np.concatenate(([0], np.cumsum(block)[:-1]))
+
+
+def _min_plus_max(first: 'np.ndarray', rest: Iterator['np.ndarray'], length: int) -> int:
+    """
+    Smallest + largest of the first 'length' numbers of 'first' followed by the blocks of 'rest'.
+    """
+    lowest = highest = None
+    block = first
+    while True:
+        part = block[:length]
+        if part.size:
+            low, high = int(part.min()), int(part.max())
+            lowest = low if lowest is None else min(lowest, low)
+            highest = high if highest is None else max(highest, high)
+        length -= len(part)
+        if not length:
+            return lowest + highest
+        block = next(rest)
+
+
+def range_min_max(blocks: Iterable['np.ndarray'],
+                  start_blocks: Iterable['np.ndarray'],
+                  target: int,
+                  min_length: int = 2) -> Optional[int]:
+    """
+    Find contiguous range of non-negative numbers of at least 'min_length' that sums to 'target'.
+
+    Two pointers over the same numbers, each reading its own iterator of blocks:
+    one for the ends of ranges, one trailing behind for their starts.
+    The sum before a start is looked up with searchsorted for a whole block of ends at once.
+    Only one block of each is in memory, so memory is bounded by twice the block size
+    however long the range is.
+
+    >>> numbers = ['35', '20', '15', '25', '47', '40', '62', '55', '65', '95',
+    ...            '102', '117', '150', '182', '127', '219']
+    >>> range_min_max(read_blocks(numbers, 4), read_blocks(numbers, 4), 127)
+    62
+
+    >>> range_min_max(read_blocks(numbers, 3), read_blocks(numbers, 5), 20, min_length=2) is None
+    True
+
+    :param blocks: of non-negative numbers
+    :param start_blocks: of the same numbers, independent of 'blocks', eg. from a second open file
+    :param target: sum of range
+    :param min_length: minimum number of elements in range, at least 1
+    :return: smallest + largest element of range, None if there is no such range
+    """
+    _require_numpy()
+    start_blocks = iter(start_blocks)
+    start_block = next(start_blocks, None)
+    if start_block is None:
+        return None
+    # index of first number in start block, and sum of numbers before it
+    start_index, start_sum = 0, 0
+    start_prefix = _start_prefix(start_block, start_sum)
+
+    # index of first number in end block, and sum of numbers before it
+    end_index, end_sum = 0, 0
+    for block in blocks:
+        # range ending after block[i] sums to target if it starts where the sum before is needed[i]
+        ends = end_index + 1 + np.arange(len(block))
+        needed = end_sum + np.cumsum(block) - target
+        done = 0
+        while done < len(block):
+            # ends that need a start in the start block, needed only grows
+            cut = done + int(np.searchsorted(needed[done:], start_prefix[-1], 'right'))
+            # earliest start, longest range
+            positions = np.searchsorted(start_prefix, needed[done:cut], 'left')
+            found = (start_prefix[positions] == needed[done:cut]) & \
+                    (ends[done:cut] - start_index - positions >= min_length)
+            hits = np.flatnonzero(found)
+            if hits.size:
+                position, end = int(positions[hits[0]]), int(ends[done + hits[0]])
+                return _min_plus_max(start_block[position:], start_blocks, end - start_index - position)
+
+            done = cut
+            if done < len(block):
+                start_index += len(start_block)
+                start_sum += int(start_block.sum())
+                start_block = next(start_blocks, None)
+                if start_block is None:
+                    return None
+                start_prefix = _start_prefix(start_block, start_sum)
+        end_index += len(block)
+        end_sum += int(block.sum())
+    return None
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
+
+    with open('input.txt', 'rt') as puzzle:
+        has_no_sum = first_invalid(read_blocks(puzzle))
+    print('First number that has no sum in its preamble:', has_no_sum)
+
+    with open('input.txt', 'rt') as puzzle, open('input.txt', 'rt') as starts:
+        min_max_sum = range_min_max(read_blocks(puzzle), read_blocks(starts), has_no_sum)
+    print(f'_min_ + _max_ of contiguous range that sums to {has_no_sum}: {min_max_sum}')